@@ -18,6 +18,7 @@ import time
 import logging
 import requests
 import threading
+import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, asdict
@@ -86,6 +87,27 @@ class ManusApiConfig:
     enable_websocket: bool = True
     enable_auto_retry: bool = True
 
+# Bytes read per chunk when streaming a file upload
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def _iter_multipart_upload(file_path: str, metadata: Dict[str, Any], boundary: str):
+    """Yield a multipart/form-data body for a file upload, reading the file in chunks"""
+    file_name = os.path.basename(file_path).replace('"', '%22')
+    yield (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="metadata"\r\n\r\n'
+        f'{json.dumps(metadata)}\r\n'
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{file_name}"\r\n'
+        f'Content-Type: application/octet-stream\r\n\r\n'
+    ).encode('utf-8')
+    
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+            yield chunk
+    
+    yield f'\r\n--{boundary}--\r\n'.encode('utf-8')
+
 class ManusApiClient:
     """Main API client for Manus platform integration"""
     
@@ -489,6 +511,22 @@ class ManusApiClient:
             result = response.json()
             return result.get('file_id', '')
     
+    def submit_content_stream(self, file_path: str, metadata: Dict[str, Any] = None) -> str:
+        """Upload a large file to Manus as a chunked multipart body, never holding it in memory"""
+        boundary = uuid.uuid4().hex
+        
+        # A generator body cannot be replayed, so this bypasses _make_request's retries
+        response = self.session.post(
+            f"{self.config.api_endpoint.rstrip('/')}/api/v1/files",
+            data=_iter_multipart_upload(file_path, metadata or {}, boundary),
+            headers={'Content-Type': f'multipart/form-data; boundary={boundary}'},
+            timeout=self.config.timeout
+        )
+        response.raise_for_status()
+        
+        result = response.json()
+        return result.get('file_id', '')
+    
     def download_file(self, file_id: str, output_path: str) -> bool:
         """Download file from Manus"""
         try:
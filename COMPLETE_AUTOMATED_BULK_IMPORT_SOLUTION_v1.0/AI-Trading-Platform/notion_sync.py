@@ -31,6 +31,7 @@ import markdown
 import csv
 from notion_client import Client as NotionClient
 from notion_client.errors import APIResponseError, RequestTimeoutError
+from sync.monitor import compile_excluded_patterns
 
 # Configuration and Constants
 CONFIG_FILE = "sync_config.yaml"
@@ -39,6 +40,8 @@ LOG_FILE = "sync.log"
 DEFAULT_SYNC_INTERVAL = 30  # seconds
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
+CHECKSUM_CHUNK_SIZE = 1024 * 1024  # bytes per read when hashing without file_digest
+NOTION_REQUESTS_PER_SECOND = 3  # Notion's average request rate limit per integration
 
 @dataclass
 class SyncConfig:
@@ -84,6 +87,14 @@ class NotionSyncManager:
     
     def __init__(self, config_path: str = CONFIG_FILE):
         self.config_path = config_path
+        # Guards self.state; syncs may run on several threads while state is saved
+        self._state_lock = threading.RLock()
+        # Paces Notion API calls across every thread syncing through this manager
+        self._rate_lock = threading.Lock()
+        self._next_request_time = 0.0
+        # Exclusion regex shared with the file monitor, recompiled if the patterns are replaced
+        self._excluded_patterns_key = None
+        self._excluded_re = None
         self.config = self._load_config()
         self.state = self._load_state()
         self.notion_client = NotionClient(auth=self.config.notion_token)
@@ -148,8 +159,9 @@ class NotionSyncManager:
     def _save_state(self):
         """Save synchronization state to JSON file"""
         try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(asdict(self.state), f, indent=2)
+            with self._state_lock:
+                with open(STATE_FILE, 'w') as f:
+                    json.dump(asdict(self.state), f, indent=2)
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
     
@@ -181,31 +193,36 @@ class NotionSyncManager:
     def calculate_file_checksum(self, file_path: str) -> str:
         """Calculate MD5 checksum of a file"""
         try:
-            hash_md5 = hashlib.md5()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
+                # file_digest hashes through one reusable buffer without per-chunk copies (3.11+)
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, 'md5').hexdigest()
+                
+                hash_md5 = hashlib.md5()
+                for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
                     hash_md5.update(chunk)
             return hash_md5.hexdigest()
         except Exception as e:
             self.logger.error(f"Error calculating checksum for {file_path}: {e}")
             return ""
     
-    def should_sync_file(self, file_path: str) -> bool:
+    def should_sync_file(self, file_path: str, file_size: Optional[int] = None) -> bool:
         """Determine if a file should be synchronized"""
         # Check file size
         try:
-            file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+            if file_size is None:
+                file_size = os.path.getsize(file_path)
+            file_size_mb = file_size / (1024 * 1024)
             if file_size_mb > self.config.max_file_size_mb:
                 self.logger.warning(f"File {file_path} exceeds size limit ({file_size_mb:.2f}MB)")
                 return False
         except OSError:
             return False
         
-        # Check excluded patterns
-        file_name = os.path.basename(file_path)
-        for pattern in self.config.excluded_patterns:
-            if pattern.replace('*', '') in file_name or pattern in file_path:
-                return False
+        # Check excluded patterns with the same regex the file monitor uses
+        excluded_re = self._excluded_regex()
+        if excluded_re is not None and excluded_re.search(file_path):
+            return False
         
         # Check if file is in sync directories
         for sync_dir in self.config.sync_directories:
@@ -214,6 +231,14 @@ class NotionSyncManager:
         
         return False
     
+    def _excluded_regex(self):
+        """Compiled exclusion regex for the current config's excluded_patterns"""
+        patterns = tuple(self.config.excluded_patterns or ())
+        if patterns != self._excluded_patterns_key:
+            self._excluded_re = compile_excluded_patterns(list(patterns))
+            self._excluded_patterns_key = patterns
+        return self._excluded_re
+    
     def convert_markdown_to_notion_blocks(self, markdown_content: str) -> List[Dict[str, Any]]:
         """Convert Markdown content to Notion blocks"""
         blocks = []
@@ -315,6 +340,16 @@ class NotionSyncManager:
         
         return blocks
     
+    def _wait_for_notion_slot(self):
+        """Block until another Notion API request fits within NOTION_REQUESTS_PER_SECOND"""
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_time)
+            self._next_request_time = slot + 1.0 / NOTION_REQUESTS_PER_SECOND
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
     def sync_file_to_notion(self, file_path: str) -> bool:
         """Sync a single file to Notion"""
         try:
@@ -358,12 +393,15 @@ class NotionSyncManager:
                 # Update existing page
                 try:
                     # Clear existing blocks
+                    self._wait_for_notion_slot()
                     existing_blocks = self.notion_client.blocks.children.list(block_id=page_id)
                     for block in existing_blocks.get('results', []):
+                        self._wait_for_notion_slot()
                         self.notion_client.blocks.delete(block_id=block['id'])
                     
                     # Add new blocks
                     if blocks:
+                        self._wait_for_notion_slot()
                         self.notion_client.blocks.children.append(
                             block_id=page_id,
                             children=blocks
@@ -390,46 +428,78 @@ class NotionSyncManager:
                     "children": blocks
                 }
                 
+                self._wait_for_notion_slot()
                 response = self.notion_client.pages.create(**page_data)
                 page_id = response['id']
-                self.state.notion_page_mappings[file_path] = page_id
+                with self._state_lock:
+                    self.state.notion_page_mappings[file_path] = page_id
                 self.logger.info(f"Created new Notion page for {file_path}")
             
             # Update file checksum
-            self.state.file_checksums[file_path] = self.calculate_file_checksum(file_path)
-            self.state.successful_syncs += 1
+            checksum = self.calculate_file_checksum(file_path)
+            with self._state_lock:
+                self.state.file_checksums[file_path] = checksum
+                self.state.successful_syncs += 1
             
             return True
             
         except Exception as e:
             self.logger.error(f"Error syncing {file_path} to Notion: {e}")
-            self.state.sync_errors.append({
-                "file_path": file_path,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            })
+            with self._state_lock:
+                self.state.sync_errors.append({
+                    "file_path": file_path,
+                    "error": str(e),
+                    "timestamp": datetime.now().isoformat()
+                })
             return False
     
+    def forget_files(self, file_paths: List[str]):
+        """Drop stored checksums for deleted files so they resync if recreated; page mappings are kept"""
+        with self._state_lock:
+            for file_path in file_paths:
+                self.state.file_checksums.pop(file_path, None)
+    
+    def _iter_directory_files(self, directory: str):
+        """Yield (path, size) for every file below directory, like os.walk but reusing scandir's stat"""
+        pending_dirs = [directory]
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            subdirs = []
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # os.walk lists directory symlinks but does not descend into them
+                                if not entry.is_symlink():
+                                    subdirs.append(entry.path)
+                                continue
+                            file_size = entry.stat().st_size
+                        except OSError:
+                            # Broken symlinks and vanished files are never synced
+                            continue
+                        yield entry.path, file_size
+            except OSError as e:
+                self.logger.warning(f"Cannot scan directory {current_dir}: {e}")
+            
+            # Stack subdirectories in reverse so they are walked depth first in listing order, as os.walk does
+            pending_dirs.extend(reversed(subdirs))
+    
     def sync_directory_to_notion(self, directory: str) -> int:
         """Sync all eligible files in a directory to Notion"""
         synced_count = 0
         
         try:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
+            for file_path, file_size in self._iter_directory_files(directory):
+                if self.should_sync_file(file_path, file_size):
+                    # Check if file has changed
+                    current_checksum = self.calculate_file_checksum(file_path)
+                    stored_checksum = self.state.file_checksums.get(file_path, "")
                     
-                    if self.should_sync_file(file_path):
-                        # Check if file has changed
-                        current_checksum = self.calculate_file_checksum(file_path)
-                        stored_checksum = self.state.file_checksums.get(file_path, "")
-                        
-                        if current_checksum != stored_checksum:
-                            if self.sync_file_to_notion(file_path):
-                                synced_count += 1
-                            
-                            # Rate limiting
-                            time.sleep(0.5)
+                    # sync_file_to_notion paces its own API calls
+                    if current_checksum != stored_checksum:
+                        if self.sync_file_to_notion(file_path):
+                            synced_count += 1
         
         except Exception as e:
             self.logger.error(f"Error syncing directory {directory}: {e}")
@@ -455,8 +525,9 @@ class NotionSyncManager:
                 results[sync_dir] = 0
         
         # Update state
-        self.state.last_sync_time = datetime.now().isoformat()
-        self.state.total_syncs += 1
+        with self._state_lock:
+            self.state.last_sync_time = datetime.now().isoformat()
+            self.state.total_syncs += 1
         self._save_state()
         
         elapsed_time = time.time() - start_time
@@ -28,7 +28,7 @@ from queue import Queue
 import threading
 
 # Import analysis results
-from bulk_file_analyzer import FileAnalysis, CollectionAnalysis, BulkFileAnalyzer
+from bulk_file_analyzer import FileAnalysis, CollectionAnalysis, BulkFileAnalyzer, json_default, iter_file_analyses
 
 # Notion integration
 try:
@@ -270,19 +270,16 @@ class AutomatedNotionImporter:
     def load_analysis_results(self) -> Tuple[List[FileAnalysis], CollectionAnalysis]:
         """Load file analysis results"""
         try:
-            # Load file analyses
-            file_analyses_path = self.analysis_path / 'file_analyses.json'
-            with open(file_analyses_path, 'r') as f:
-                file_analyses_data = json.load(f)
-            
-            file_analyses = [FileAnalysis(**data) for data in file_analyses_data]
+            # Load file analyses (one JSON record per line)
+            file_analyses_path = self.analysis_path / 'file_analyses.jsonl'
+            file_analyses = list(iter_file_analyses(file_analyses_path))
             
             # Load collection analysis
             collection_analysis_path = self.analysis_path / 'collection_analysis.json'
             with open(collection_analysis_path, 'r') as f:
                 collection_analysis_data = json.load(f)
             
-            collection_analysis = CollectionAnalysis(**collection_analysis_data)
+            collection_analysis = CollectionAnalysis.from_dict(collection_analysis_data)
             
             self.logger.info(f"Loaded analysis for {len(file_analyses)} files")
             return file_analyses, collection_analysis
@@ -1177,7 +1174,7 @@ class AutomatedNotionImporter:
             # Save job details
             jobs_data = [asdict(job) for job in self.import_jobs]
             with open(results_dir / 'import_jobs.json', 'w') as f:
-                json.dump(jobs_data, f, indent=2, default=str)
+                json.dump(jobs_data, f, indent=2, default=json_default)
             
             # Save batch details
             batches_data = [asdict(batch) for batch in self.import_batches]
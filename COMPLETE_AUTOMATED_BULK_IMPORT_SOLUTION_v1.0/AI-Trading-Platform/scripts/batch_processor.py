@@ -22,7 +22,7 @@ import hashlib
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
 from dataclasses import dataclass, asdict
 import concurrent.futures
 import threading
@@ -174,14 +174,13 @@ class BatchProcessor:
         
         # Load analysis results
         analysis_path = Path(analysis_results_path)
-        file_analyses = self._load_file_analyses(analysis_path)
+        # Records are streamed from disk straight into processing jobs
+        jobs = self._create_processing_jobs(self._iter_file_analyses(analysis_path))
         
-        if not file_analyses:
+        if not jobs:
             self.logger.error("No file analyses found")
             return []
         
-        # Create processing jobs
-        jobs = self._create_processing_jobs(file_analyses)
         self.jobs = jobs
         
         # Create optimized batches
@@ -193,22 +192,23 @@ class BatchProcessor:
         self.logger.info(f"Created {len(batches)} processing batches for {len(jobs)} files")
         return batches
     
-    def _load_file_analyses(self, analysis_path: Path) -> List[Dict[str, Any]]:
-        """Load file analysis results"""
+    def _iter_file_analyses(self, analysis_path: Path) -> Iterator[Dict[str, Any]]:
+        """Stream file analysis results one record at a time"""
         try:
-            file_analyses_path = analysis_path / 'file_analyses.json'
+            file_analyses_path = analysis_path / 'file_analyses.jsonl'
             if not file_analyses_path.exists():
                 self.logger.error(f"File analyses not found at {file_analyses_path}")
-                return []
+                return
             
             with open(file_analyses_path, 'r') as f:
-                return json.load(f)
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
                 
         except Exception as e:
             self.logger.error(f"Failed to load file analyses: {e}")
-            return []
     
-    def _create_processing_jobs(self, file_analyses: List[Dict[str, Any]]) -> List[FileProcessingJob]:
+    def _create_processing_jobs(self, file_analyses: Iterable[Dict[str, Any]]) -> List[FileProcessingJob]:
         """Create individual processing jobs from file analyses"""
         jobs = []
         
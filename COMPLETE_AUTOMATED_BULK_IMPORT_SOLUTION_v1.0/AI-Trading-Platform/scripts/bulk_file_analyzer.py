@@ -17,38 +17,146 @@ Target: 340 files (4GB) automated Notion import
 import os
 import json
 import hashlib
+import mmap
+from array import array
 import mimetypes
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator, NamedTuple
 from dataclasses import dataclass, asdict
-import magic
+from collections import Counter, defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import importlib
+import importlib.util
+import threading
 import chardet
 
-# Advanced content analysis libraries
+# BLAKE3 is SIMD-accelerated and multithreaded; SHA-256 is the fallback
 try:
-    import textract
-    TEXTRACT_AVAILABLE = True
+    import blake3
+    BLAKE3_AVAILABLE = True
 except ImportError:
-    TEXTRACT_AVAILABLE = False
-    print("Warning: textract not available. Install with: pip install textract")
+    BLAKE3_AVAILABLE = False
 
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    print("Warning: PIL not available. Install with: pip install Pillow")
+HASH_ALGORITHM = 'blake3' if BLAKE3_AVAILABLE else 'sha256'
 
+# Reports and resume files go through orjson when it is installed
 try:
-    import pandas as pd
-    PANDAS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PANDAS_AVAILABLE = False
-    print("Warning: pandas not available. Install with: pip install pandas")
+    ORJSON_AVAILABLE = False
 
-@dataclass
+# Advanced content analysis libraries are imported on first use, so short runs
+# and freshly spawned worker processes only pay for what the collection needs
+_OPTIONAL_MODULES: Dict[str, Any] = {}
+_OPTIONAL_MODULES_LOCK = threading.Lock()
+_OPTIONAL_INSTALL_HINTS = {
+    'magic': ('magic', 'python-magic'),
+    'textract': ('textract', 'textract'),
+    'PIL.Image': ('PIL', 'Pillow'),
+    'pandas': ('pandas', 'pandas')
+}
+
+# Slice size fed to the hasher per update (one readahead window)
+HASH_BUFFER_SIZE = 1024 * 1024
+
+# Leading bytes hashed to split same-size duplicate candidates before full hashing
+PARTIAL_HASH_SIZE = 4096
+
+# Scoring tables shared by every per-file scoring call
+TYPE_PRIORITIES = {
+    'document': 20,
+    'presentation': 15,
+    'spreadsheet': 15,
+    'data': 10,
+    'image': 5,
+    'code': 10,
+    'video': -5,
+    'audio': -5,
+    'archive': -10,
+    'other': -15
+}
+PRIORITY_BOOST_WORDS = ('important', 'critical', 'urgent', 'final')
+PRIORITY_PENALTY_WORDS = ('draft', 'temp', 'backup', 'old')
+PASS_THROUGH_BATCH_SIZE = 20 * 1024 * 1024  # Files this large form a batch on their own
+
+IMPORT_SECONDS_PER_MB = {
+    'low': 0.5,
+    'medium': 2.0,
+    'high': 5.0
+}
+
+def _optional_import(module_name: str) -> Optional[Any]:
+    """Import an optional dependency once, returning None if it is unavailable"""
+    if module_name in _OPTIONAL_MODULES:
+        return _OPTIONAL_MODULES[module_name]
+    
+    # Pool threads may ask for the same module at once; only one of them imports it.
+    # Missing modules are reported once per run by the analyzer, not here in every worker
+    with _OPTIONAL_MODULES_LOCK:
+        if module_name not in _OPTIONAL_MODULES:
+            try:
+                _OPTIONAL_MODULES[module_name] = importlib.import_module(module_name)
+            except ImportError:
+                _OPTIONAL_MODULES[module_name] = None
+        return _OPTIONAL_MODULES[module_name]
+
+def _content_hasher(data: bytes = b'', multithreaded: bool = False):
+    """Create a content hash object using HASH_ALGORITHM"""
+    if BLAKE3_AVAILABLE:
+        max_threads = blake3.blake3.AUTO if multithreaded else 1
+        return blake3.blake3(data, max_threads=max_threads)
+    return hashlib.sha256(data)
+
+def _digest_mapped(mapped: mmap.mmap) -> bytes:
+    """Hash a memory-mapped file in HASH_BUFFER_SIZE slices without copying"""
+    if hasattr(mmap, 'MADV_SEQUENTIAL'):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    
+    hasher = _content_hasher(multithreaded=True)
+    with memoryview(mapped) as view:
+        for offset in range(0, len(view), HASH_BUFFER_SIZE):
+            hasher.update(view[offset:offset + HASH_BUFFER_SIZE])
+    return hasher.digest()
+
+def _digest_stream(f) -> bytes:
+    """Hash an open binary file by streaming reads"""
+    if hasattr(hashlib, 'file_digest'):
+        return hashlib.file_digest(f, lambda: _content_hasher(multithreaded=True)).digest()
+    
+    # Python < 3.11: reuse one buffer instead of allocating bytes per chunk
+    hasher = _content_hasher(multithreaded=True)
+    buffer = bytearray(HASH_BUFFER_SIZE)
+    view = memoryview(buffer)
+    while True:
+        bytes_read = f.readinto(buffer)
+        if not bytes_read:
+            break
+        hasher.update(view[:bytes_read])
+    return hasher.digest()
+
+# Digest of zero bytes, shared by every empty file
+EMPTY_DIGEST = _content_hasher().digest()
+
+def json_default(value: Any) -> Any:
+    """JSON fallback serializer: hex-encode raw digests, stringify everything else"""
+    if isinstance(value, bytes):
+        return value.hex()
+    return str(value)
+
+def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize dataclasses and plain data to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=json_default, option=option)
+    
+    if hasattr(obj, '__dataclass_fields__'):
+        obj = asdict(obj)
+    return json.dumps(obj, indent=2 if indent else None, default=json_default).encode('utf-8')
+
+@dataclass(slots=True)
 class FileAnalysis:
     """Comprehensive file analysis results"""
     file_path: str
@@ -57,7 +165,9 @@ class FileAnalysis:
     file_type: str
     mime_type: str
     encoding: Optional[str]
-    content_hash: str
+    # Raw HASH_ALGORITHM digest, hex-encoded only when serialized. Only computed
+    # for files sharing their size and first block with another file
+    content_hash: Optional[bytes]
     created_date: Optional[str]
     modified_date: str
     
@@ -82,6 +192,41 @@ class FileAnalysis:
     analysis_confidence: float
     processing_complexity: str
     estimated_import_time: float
+    
+    # Digest of the first PARTIAL_HASH_SIZE bytes, used by duplicate pre-filtering
+    partial_hash: Optional[bytes] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'FileAnalysis':
+        """Rebuild an analysis from its serialized JSON form"""
+        data = dict(data)
+        for field_name in ('content_hash', 'partial_hash'):
+            if data.get(field_name) is not None:
+                data[field_name] = bytes.fromhex(data[field_name])
+        return cls(**data)
+
+def iter_file_analyses(results_path: Path) -> Iterator[FileAnalysis]:
+    """Lazily read analyses from a file_analyses.jsonl stream, one record at a time"""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    with open(results_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield FileAnalysis.from_dict(loads(line))
+
+class DupResult(NamedTuple):
+    """Duplicate groups with the number of redundant copies they contain"""
+    groups: List[List[str]]
+    total_redundant: int
+
+@dataclass(slots=True)
+class Batch:
+    """One planned processing batch"""
+    batch_id: int
+    priority_pool: str
+    files: List[str]
+    total_size: int
+    file_count: int
+    estimated_time: float
 
 @dataclass
 class CollectionAnalysis:
@@ -101,7 +246,7 @@ class CollectionAnalysis:
     duplicate_groups: List[List[str]]
     
     # Import planning
-    processing_batches: List[Dict[str, Any]]
+    processing_batches: List[Batch]
     estimated_total_time: float
     resource_requirements: Dict[str, Any]
     
@@ -109,22 +254,59 @@ class CollectionAnalysis:
     analysis_quality: Dict[str, float]
     potential_issues: List[str]
     optimization_recommendations: List[str]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CollectionAnalysis':
+        """Rebuild a collection analysis from its serialized JSON form"""
+        data = dict(data)
+        data['processing_batches'] = [Batch(**batch) for batch in data['processing_batches']]
+        return cls(**data)
 
 class BulkFileAnalyzer:
     """Advanced bulk file analyzer for automated Notion import"""
     
-    def __init__(self, target_directory: str, output_directory: str = "analysis_results"):
+    def __init__(self, target_directory: str, output_directory: str = "analysis_results",
+                 max_workers: Optional[int] = None, use_processes: bool = False):
         self.target_directory = Path(target_directory)
         self.output_directory = Path(output_directory)
         self.output_directory.mkdir(exist_ok=True)
+        # Per-file analysis is mostly I/O bound, so threads are the default;
+        # processes suit CPU-heavy content extraction
+        self.use_processes = use_processes
+        self.max_workers = max_workers or min(32, 4 * (os.cpu_count() or 1))
+        
+        # Reference time for file age scoring, read once rather than per file
+        self._reference_time = datetime.now().timestamp()
+        
+        # Batch planning limits
+        self.max_batch_files = 20
+        self.max_batch_size = 50 * 1024 * 1024
         
         # Setup logging
         self.logger = self._setup_logging()
         
         # Analysis results
+        self._duplicates_cache: Optional[DupResult] = None
         self.file_analyses: List[FileAnalysis] = []
+        
+        # Column views of per-file numeric fields, rebuilt before aggregation
+        self._sizes = array('q')
+        self._priorities = array('i')
+        self._import_times = array('d')
+        self._confidences = array('d')
+        
+        # Type counts, built once and shared by the summary, issues and recommendations
+        self._file_type_counter: Counter = Counter()
+        self._content_type_counter: Counter = Counter()
+        self._summarized_count = 0
         self.collection_analysis: Optional[CollectionAnalysis] = None
         
+        # Incremental re-analysis cache keyed by (st_dev, st_ino, st_mtime_ns, st_size)
+        self.analysis_cache_path = self.output_directory / 'analysis_cache.json'
+        self._analysis_cache: Dict[str, Dict[str, Any]] = self._load_analysis_cache()
+        self._fresh_cache: Dict[str, Dict[str, Any]] = {}
+        self._cache_keys: Dict[str, str] = {}
+        
         # Content type classifiers
         self.content_classifiers = {
             'document': self._classify_document,
@@ -193,6 +375,16 @@ class BulkFileAnalyzer:
             }
         }
     
+    @property
+    def file_analyses(self) -> List[FileAnalysis]:
+        """Per-file analysis results"""
+        return self._file_analyses
+    
+    @file_analyses.setter
+    def file_analyses(self, analyses: List[FileAnalysis]):
+        self._file_analyses = analyses
+        self._duplicates_cache = None
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup comprehensive logging for analysis operations"""
         logger = logging.getLogger('bulk_file_analyzer')
@@ -225,25 +417,30 @@ class BulkFileAnalyzer:
         self.logger.info(f"Starting bulk analysis of {self.target_directory}")
         
         start_time = datetime.now()
-        
-        # Discover all files
-        all_files = self._discover_files()
-        self.logger.info(f"Discovered {len(all_files)} files for analysis")
-        
-        # Analyze each file
-        for i, file_path in enumerate(all_files, 1):
-            try:
-                self.logger.info(f"Analyzing file {i}/{len(all_files)}: {file_path.name}")
-                analysis = self._analyze_file(file_path)
+        self._warn_missing_optional_modules()
+        
+        # Stream discovered files straight into the worker pool so directory
+        # traversal overlaps with per-file analysis
+        discovered = 0
+        with self._create_executor() as executor:
+            task = _analyze_in_worker if self.use_processes else self._analyze_task
+            results = executor.map(task, self._discover_files(), chunksize=16)
+            
+            for discovered, (file_path, cache_key, analysis, error) in enumerate(results, 1):
+                if error is not None:
+                    self.logger.error(f"Error analyzing {file_path}: {error}")
+                    continue
+                
+                self.logger.info(f"Analyzed file {discovered}: {file_path.name}")
                 self.file_analyses.append(analysis)
+                self._remember_analysis(cache_key, analysis)
                 
                 # Progress reporting
-                if i % 50 == 0:
-                    self.logger.info(f"Progress: {i}/{len(all_files)} files analyzed")
-                    
-            except Exception as e:
-                self.logger.error(f"Error analyzing {file_path}: {e}")
-                continue
+                if discovered % 50 == 0:
+                    self.logger.info(f"Progress: {discovered} files analyzed")
+        
+        self.logger.info(f"Discovered {discovered} files for analysis")
+        self._duplicates_cache = None
         
         # Generate collection analysis
         self.collection_analysis = self._generate_collection_analysis()
@@ -259,26 +456,67 @@ class BulkFileAnalyzer:
         
         return self.collection_analysis
     
-    def _discover_files(self) -> List[Path]:
-        """Discover all files in target directory recursively"""
-        all_files = []
+    def _write_file_analyses(self):
+        """Write file_analyses.jsonl as one JSON record per line, in analysis order"""
+        results_path = self.output_directory / 'file_analyses.jsonl'
+        with open(results_path, 'wb', buffering=1024 * 1024) as results_file:
+            for analysis in self.file_analyses:
+                results_file.write(_json_bytes(analysis) + b'\n')
+    
+    def _warn_missing_optional_modules(self):
+        """Log each optional content analysis library that is not installed, once per run"""
+        for display_name, package in _OPTIONAL_INSTALL_HINTS.values():
+            if importlib.util.find_spec(display_name) is None:
+                self.logger.warning(f"{display_name} not available. Install with: pip install {package}")
+    
+    def _create_executor(self) -> Executor:
+        """Create the worker pool used for per-file analysis"""
+        if self.use_processes:
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(str(self.target_directory), str(self.output_directory))
+            )
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+    
+    def _analyze_task(self, discovered: Tuple[Path, os.stat_result]) -> Tuple[Path, str, Optional[FileAnalysis], Optional[str]]:
+        """Analyze one discovered file for the worker pool, capturing errors instead of raising"""
+        file_path, stat = discovered
+        cache_key = self._cache_key(stat)
+        try:
+            return file_path, cache_key, self._analyze_file(file_path, stat), None
+        except Exception as e:
+            return file_path, cache_key, None, str(e)
+    
+    def _discover_files(self, directory: Optional[Path] = None) -> Iterator[Tuple[Path, os.stat_result]]:
+        """Discover all files in target directory recursively, yielding (path, stat) in sorted order"""
+        directory = directory or self.target_directory
         
-        for root, dirs, files in os.walk(self.target_directory):
-            # Skip hidden directories and common system directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', 'node_modules']]
-            
-            for file in files:
-                # Skip hidden files and common system files
-                if not file.startswith('.') and not file.endswith('.tmp'):
-                    file_path = Path(root) / file
-                    all_files.append(file_path)
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+        except OSError as e:
+            self.logger.warning(f"Could not scan directory {directory}: {e}")
+            return
         
-        return sorted(all_files)
+        for entry in entries:
+            if entry.is_dir():
+                # Skip hidden directories, common system directories and directory symlinks
+                if (not entry.is_symlink() and not entry.name.startswith('.')
+                        and entry.name not in ['__pycache__', 'node_modules']):
+                    yield from self._discover_files(Path(entry.path))
+            
+            # Skip hidden files and common system files
+            elif not entry.name.startswith('.') and not entry.name.endswith('.tmp'):
+                try:
+                    stat = entry.stat()
+                except OSError as e:
+                    self.logger.error(f"Error analyzing {entry.path}: {e}")
+                    continue
+                yield Path(entry.path), stat
     
-    def _analyze_file(self, file_path: Path) -> FileAnalysis:
+    def _analyze_file(self, file_path: Path, stat: os.stat_result) -> FileAnalysis:
         """Perform comprehensive analysis of individual file"""
         # Basic file information
-        stat = file_path.stat()
         file_size = stat.st_size
         modified_date = datetime.fromtimestamp(stat.st_mtime).isoformat()
         
@@ -289,27 +527,50 @@ class BulkFileAnalyzer:
         
         # File type detection
         mime_type = mimetypes.guess_type(str(file_path))[0] or 'application/octet-stream'
-        
-        try:
-            file_type = magic.from_file(str(file_path))
-        except:
-            file_type = mime_type
-        
-        # Content hash
-        content_hash = self._calculate_file_hash(file_path)
-        
-        # Encoding detection for text files
-        encoding = self._detect_encoding(file_path)
-        
-        # Content analysis
         content_type = self._determine_content_type(file_path, mime_type)
-        content_summary, key_topics, language = self._analyze_content(file_path, content_type)
+        
+        # Reuse content-derived results when the file is unchanged since the last run
+        cache_key = self._cache_key(stat)
+        cached = self._analysis_cache.get(cache_key)
+        
+        if file_size == 0:
+            # Empty files need no I/O: everything is known from the stat result
+            file_type = 'empty'
+            content_hash = partial_hash = EMPTY_DIGEST
+            encoding = content_summary = language = None
+            key_topics = []
+        elif cached and cached.get('content_type') == content_type:
+            file_type = cached['file_type']
+            content_hash = partial_hash = None
+            if cached.get('hash_algorithm') == HASH_ALGORITHM:
+                content_hash = bytes.fromhex(cached['content_hash']) if cached.get('content_hash') else None
+                partial_hash = bytes.fromhex(cached['partial_hash']) if cached.get('partial_hash') else None
+            encoding = cached['encoding']
+            content_summary = cached['content_summary']
+            key_topics = cached['key_topics']
+            language = cached['language']
+        else:
+            magic = _optional_import('magic')
+            try:
+                file_type = magic.from_file(str(file_path)) if magic else mime_type
+            except:
+                file_type = mime_type
+            
+            # Content hashes are computed lazily, only for duplicate candidates
+            content_hash = None
+            partial_hash = None
+            
+            # Encoding detection for text files
+            encoding = self._detect_encoding(file_path)
+            
+            # Content analysis
+            content_summary, key_topics, language = self._analyze_content(file_path, content_type)
         
         # Organization analysis
         directory_level = len(file_path.relative_to(self.target_directory).parts) - 1
         parent_directory = file_path.parent.name
         suggested_category = self._suggest_category(file_path, content_type, key_topics)
-        priority_score = self._calculate_priority_score(file_path, content_type, file_size)
+        priority_score = self._calculate_priority_score(file_path, content_type, file_size, stat)
         
         # Import strategy
         import_strategy = self.import_strategies.get(content_type, self.import_strategies['other'])
@@ -347,20 +608,73 @@ class BulkFileAnalyzer:
             processing_notes=processing_notes,
             analysis_confidence=analysis_confidence,
             processing_complexity=processing_complexity,
-            estimated_import_time=estimated_import_time
+            estimated_import_time=estimated_import_time,
+            partial_hash=partial_hash
         )
     
-    def _calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate SHA-256 hash of file content"""
+    @staticmethod
+    def _cache_key(stat: os.stat_result) -> str:
+        """Build the analysis cache key for a file from its stat result"""
+        return f"{stat.st_dev}:{stat.st_ino}:{stat.st_mtime_ns}:{stat.st_size}"
+    
+    def _remember_analysis(self, cache_key: str, analysis: FileAnalysis):
+        """Store the content-derived parts of an analysis in this run's cache"""
+        self._cache_keys[analysis.file_path] = cache_key
+        self._fresh_cache[cache_key] = {
+            'content_type': analysis.content_type,
+            'file_type': analysis.file_type,
+            'hash_algorithm': HASH_ALGORITHM,
+            'content_hash': analysis.content_hash.hex() if analysis.content_hash else None,
+            'partial_hash': analysis.partial_hash.hex() if analysis.partial_hash else None,
+            'encoding': analysis.encoding,
+            'content_summary': analysis.content_summary,
+            'key_topics': analysis.key_topics,
+            'language': analysis.language
+        }
+    
+    def _load_analysis_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load cached per-file analysis results from a previous run"""
+        if not self.analysis_cache_path.exists():
+            return {}
+        
+        try:
+            with open(self.analysis_cache_path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable analysis cache {self.analysis_cache_path}: {e}")
+            return {}
+    
+    def _save_analysis_cache(self):
+        """Persist analysis cache entries for files seen in this run"""
+        try:
+            self.analysis_cache_path.write_bytes(_json_bytes(self._fresh_cache))
+        except Exception as e:
+            self.logger.warning(f"Could not save analysis cache: {e}")
+    
+    def _calculate_partial_hash(self, file_path: Path) -> Optional[bytes]:
+        """Calculate raw digest of the first PARTIAL_HASH_SIZE bytes"""
+        try:
+            with open(file_path, "rb") as f:
+                return _content_hasher(f.read(PARTIAL_HASH_SIZE)).digest()
+        except Exception as e:
+            self.logger.warning(f"Could not calculate partial hash for {file_path}: {e}")
+            return None
+    
+    def _calculate_file_hash(self, file_path: Path) -> Optional[bytes]:
+        """Calculate raw digest of file content"""
         try:
-            hash_sha256 = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Empty or unmappable files are streamed instead
+                    return _digest_stream(f)
+                
+                with mapped:
+                    return _digest_mapped(mapped)
         except Exception as e:
             self.logger.warning(f"Could not calculate hash for {file_path}: {e}")
-            return "unknown"
+            return None
     
     def _detect_encoding(self, file_path: Path) -> Optional[str]:
         """Detect text encoding for text files"""
@@ -421,40 +735,41 @@ class BulkFileAnalyzer:
         language = None
         
         try:
-            if content_type == 'document' and TEXTRACT_AVAILABLE:
-                # Extract text content
-                text = textract.process(str(file_path)).decode('utf-8')
-                
-                # Generate summary (first 200 characters)
-                content_summary = text[:200].strip() + "..." if len(text) > 200 else text.strip()
-                
-                # Extract key topics (simple keyword extraction)
-                words = text.lower().split()
-                word_freq = {}
-                for word in words:
-                    if len(word) > 4 and word.isalpha():
-                        word_freq[word] = word_freq.get(word, 0) + 1
-                
-                # Get top 5 most frequent words as topics
-                key_topics = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:5]
-                key_topics = [word for word, freq in key_topics]
-                
-                # Simple language detection (very basic)
-                if any(word in text.lower() for word in ['the', 'and', 'or', 'but', 'in', 'on', 'at']):
-                    language = 'english'
+            if content_type == 'document':
+                textract = _optional_import('textract')
+                if textract:
+                    # Extract text content
+                    text = textract.process(str(file_path)).decode('utf-8')
+                    
+                    # Generate summary (first 200 characters)
+                    content_summary = text[:200].strip() + "..." if len(text) > 200 else text.strip()
+                    
+                    # Extract key topics (simple keyword extraction)
+                    words = text.lower().split()
+                    word_freq = Counter(word for word in words if len(word) > 4 and word.isalpha())
+                    
+                    # Get top 5 most frequent words as topics (heap selection, not a full sort)
+                    key_topics = [word for word, freq in word_freq.most_common(5)]
+                    
+                    # Simple language detection (very basic)
+                    if any(word in text.lower() for word in ['the', 'and', 'or', 'but', 'in', 'on', 'at']):
+                        language = 'english'
             
-            elif content_type == 'spreadsheet' and PANDAS_AVAILABLE:
+            elif content_type == 'spreadsheet':
+                pd = _optional_import('pandas')
                 # Analyze spreadsheet structure
-                if file_path.suffix.lower() == '.csv':
+                if pd and file_path.suffix.lower() == '.csv':
                     df = pd.read_csv(file_path, nrows=5)
                     content_summary = f"CSV with {len(df.columns)} columns: {', '.join(df.columns[:5])}"
                     key_topics = list(df.columns[:10])
                 
-            elif content_type == 'image' and PIL_AVAILABLE:
-                # Analyze image properties
-                with Image.open(file_path) as img:
-                    content_summary = f"Image: {img.format}, {img.size[0]}x{img.size[1]}, {img.mode}"
-                    key_topics = [img.format.lower(), f"{img.size[0]}x{img.size[1]}"]
+            elif content_type == 'image':
+                Image = _optional_import('PIL.Image')
+                if Image:
+                    # Analyze image properties
+                    with Image.open(file_path) as img:
+                        content_summary = f"Image: {img.format}, {img.size[0]}x{img.size[1]}, {img.mode}"
+                        key_topics = [img.format.lower(), f"{img.size[0]}x{img.size[1]}"]
             
         except Exception as e:
             self.logger.debug(f"Content analysis failed for {file_path}: {e}")
@@ -500,24 +815,13 @@ class BulkFileAnalyzer:
         
         return category_mapping.get(content_type, 'Miscellaneous')
     
-    def _calculate_priority_score(self, file_path: Path, content_type: str, file_size: int) -> int:
+    def _calculate_priority_score(self, file_path: Path, content_type: str, file_size: int,
+                                  stat: os.stat_result) -> int:
         """Calculate import priority score (1-100)"""
         score = 50  # Base score
         
         # Content type priority
-        type_priorities = {
-            'document': 20,
-            'presentation': 15,
-            'spreadsheet': 15,
-            'data': 10,
-            'image': 5,
-            'code': 10,
-            'video': -5,
-            'audio': -5,
-            'archive': -10,
-            'other': -15
-        }
-        score += type_priorities.get(content_type, 0)
+        score += TYPE_PRIORITIES.get(content_type, 0)
         
         # File size consideration (prefer smaller files for faster processing)
         if file_size < 1024 * 1024:  # < 1MB
@@ -527,24 +831,20 @@ class BulkFileAnalyzer:
         elif file_size > 100 * 1024 * 1024:  # > 100MB
             score -= 20
         
-        # Recent files get higher priority
-        try:
-            stat = file_path.stat()
-            days_old = (datetime.now().timestamp() - stat.st_mtime) / (24 * 3600)
-            if days_old < 30:
-                score += 15
-            elif days_old < 90:
-                score += 10
-            elif days_old > 365:
-                score -= 10
-        except:
-            pass
+        # Recent files get higher priority (age compared in seconds, no per-file division)
+        age_seconds = self._reference_time - stat.st_mtime
+        if age_seconds < 30 * 24 * 3600:
+            score += 15
+        elif age_seconds < 90 * 24 * 3600:
+            score += 10
+        elif age_seconds > 365 * 24 * 3600:
+            score -= 10
         
         # File name hints
         name_lower = file_path.name.lower()
-        if any(word in name_lower for word in ['important', 'critical', 'urgent', 'final']):
+        if any(word in name_lower for word in PRIORITY_BOOST_WORDS):
             score += 15
-        elif any(word in name_lower for word in ['draft', 'temp', 'backup', 'old']):
+        elif any(word in name_lower for word in PRIORITY_PENALTY_WORDS):
             score -= 10
         
         return max(1, min(100, score))
@@ -604,15 +904,8 @@ class BulkFileAnalyzer:
     
     def _estimate_import_time(self, file_size: int, complexity: str) -> float:
         """Estimate import processing time in seconds"""
-        # Base time per MB
-        base_time_per_mb = {
-            'low': 0.5,
-            'medium': 2.0,
-            'high': 5.0
-        }
-        
         size_mb = file_size / (1024 * 1024)
-        base_time = size_mb * base_time_per_mb.get(complexity, 2.0)
+        base_time = size_mb * IMPORT_SECONDS_PER_MB.get(complexity, 2.0)
         
         # Minimum time
         return max(1.0, base_time)
@@ -657,17 +950,27 @@ class BulkFileAnalyzer:
         """Classify other files"""
         return {'subtype': 'unknown', 'processing': 'file_reference'}
     
+    def _build_columns(self):
+        """Extract per-file numeric fields into contiguous arrays for aggregation"""
+        analyses = self.file_analyses
+        self._sizes = array('q', [a.file_size for a in analyses])
+        self._priorities = array('i', [a.priority_score for a in analyses])
+        self._import_times = array('d', [a.estimated_import_time for a in analyses])
+        self._confidences = array('d', [a.analysis_confidence for a in analyses])
+        self._file_type_counter = Counter(a.file_type for a in analyses)
+        self._content_type_counter = Counter(a.content_type for a in analyses)
+        self._summarized_count = sum(1 for a in analyses if a.content_summary)
+    
     def _generate_collection_analysis(self) -> CollectionAnalysis:
         """Generate comprehensive analysis of entire collection"""
+        self._build_columns()
+        
         total_files = len(self.file_analyses)
-        total_size = sum(analysis.file_size for analysis in self.file_analyses)
+        total_size = sum(self._sizes)
         
         # File type distribution
-        file_types = {}
-        content_types = {}
-        for analysis in self.file_analyses:
-            file_types[analysis.file_type] = file_types.get(analysis.file_type, 0) + 1
-            content_types[analysis.content_type] = content_types.get(analysis.content_type, 0) + 1
+        file_types = dict(self._file_type_counter)
+        content_types = dict(self._content_type_counter)
         
         # Size distribution
         size_ranges = {
@@ -678,8 +981,7 @@ class BulkFileAnalyzer:
             'huge': 0       # > 100MB
         }
         
-        for analysis in self.file_analyses:
-            size = analysis.file_size
+        for size in self._sizes:
             if size < 1024:
                 size_ranges['tiny'] += 1
             elif size < 1024 * 1024:
@@ -698,13 +1000,13 @@ class BulkFileAnalyzer:
         suggested_organization = self._generate_organization_suggestions()
         
         # Duplicate detection
-        duplicate_groups = self._detect_duplicates()
+        duplicate_groups = self._detect_duplicates().groups
         
         # Processing batches
         processing_batches = self._create_processing_batches()
         
         # Time estimation
-        estimated_total_time = sum(analysis.estimated_import_time for analysis in self.file_analyses)
+        estimated_total_time = sum(self._import_times)
         
         # Resource requirements
         resource_requirements = self._calculate_resource_requirements()
@@ -769,43 +1071,106 @@ class BulkFileAnalyzer:
         
         return organization
     
-    def _detect_duplicates(self) -> List[List[str]]:
-        """Detect duplicate files based on content hash"""
-        hash_groups = {}
-        
+    def _detect_duplicates(self) -> DupResult:
+        """Detect duplicate files based on content hash (computed once per analysis)"""
+        if self._duplicates_cache is None:
+            self._duplicates_cache = self._compute_duplicates()
+        return self._duplicates_cache
+    
+    def _compute_duplicates(self) -> DupResult:
+        """Group analyzed files by size, then first-block hash, then full content hash"""
+        # Stage 1: only files sharing a size can be duplicates
+        size_groups = self._size_groups()
+        
+        # Stage 2: drop candidates whose first block already differs
+        partial_groups: Dict[Tuple[int, bytes], List[FileAnalysis]] = defaultdict(list)
+        for size, group in size_groups.items():
+            for analysis in group:
+                if analysis.partial_hash is None:
+                    analysis.partial_hash = self._calculate_partial_hash(Path(analysis.file_path))
+                    self._update_cached_hashes(analysis)
+                if analysis.partial_hash is not None:
+                    partial_groups[(size, analysis.partial_hash)].append(analysis)
+        
+        # Stage 3: hash full content only for files that still collide
+        hash_groups: Dict[bytes, List[str]] = defaultdict(list)
+        for (size, _), group in partial_groups.items():
+            if len(group) < 2:
+                continue
+            
+            for analysis in group:
+                if analysis.content_hash is None:
+                    if size <= PARTIAL_HASH_SIZE:
+                        # The partial hash already covers the whole file
+                        analysis.content_hash = analysis.partial_hash
+                    else:
+                        analysis.content_hash = self._calculate_file_hash(Path(analysis.file_path))
+                    self._update_cached_hashes(analysis)
+                if analysis.content_hash is not None:
+                    hash_groups[analysis.content_hash].append(analysis.file_path)
+        
+        # Return groups with more than one file, counting redundant copies as they are collected
+        groups = []
+        total_redundant = 0
+        for group in hash_groups.values():
+            if len(group) > 1:
+                groups.append(group)
+                total_redundant += len(group) - 1
+        return DupResult(groups, total_redundant)
+    
+    def _size_groups(self) -> Dict[int, List[FileAnalysis]]:
+        """Group analyzed files by size, keeping only sizes shared by several files"""
+        size_groups: Dict[int, List[FileAnalysis]] = defaultdict(list)
         for analysis in self.file_analyses:
-            hash_val = analysis.content_hash
-            if hash_val != 'unknown':
-                if hash_val not in hash_groups:
-                    hash_groups[hash_val] = []
-                hash_groups[hash_val].append(analysis.file_path)
+            size_groups[analysis.file_size].append(analysis)
         
-        # Return groups with more than one file
-        return [group for group in hash_groups.values() if len(group) > 1]
+        return {size: group for size, group in size_groups.items() if len(group) > 1}
     
-    def _create_processing_batches(self) -> List[Dict[str, Any]]:
+    def _update_cached_hashes(self, analysis: FileAnalysis):
+        """Record lazily computed hashes in this run's analysis cache"""
+        cache_key = self._cache_keys.get(analysis.file_path)
+        if cache_key is not None:
+            self._remember_analysis(cache_key, analysis)
+    
+    def _create_processing_batches(self) -> List[Batch]:
         """Create optimal processing batches"""
-        # Sort by priority score
-        sorted_analyses = sorted(self.file_analyses, key=lambda x: x.priority_score, reverse=True)
+        # Sort by priority score, keyed on the precomputed priority column
+        priorities = self._priorities
+        order = sorted(range(len(priorities)), key=priorities.__getitem__, reverse=True)
+        sorted_analyses = [self.file_analyses[i] for i in order]
+        if not sorted_analyses:
+            return []
+        
+        # Split at the median priority so high-priority batches can be scheduled
+        # on their own worker pool; batches never mix the two pools
+        median_priority = sorted_analyses[(len(sorted_analyses) - 1) // 2].priority_score
+        split = next((i for i, a in enumerate(sorted_analyses) if a.priority_score < median_priority),
+                     len(sorted_analyses))
         
         batches = []
+        self._pack_batches(sorted_analyses[:split], 'high', batches)
+        self._pack_batches(sorted_analyses[split:], 'low', batches)
+        return batches
+    
+    def _pack_batches(self, sorted_analyses: List[FileAnalysis], pool: str, batches: List[Batch]):
+        """Pack priority-ordered analyses into batches for one priority pool"""
         current_batch = []
         current_batch_size = 0
-        max_batch_size = 50 * 1024 * 1024  # 50MB per batch
-        max_batch_files = 20  # 20 files per batch
+        max_batch_size = self.max_batch_size
+        pass_through_size = min(PASS_THROUGH_BATCH_SIZE, max_batch_size)
+        max_batch_files = self.max_batch_files
         
         for analysis in sorted_analyses:
+            # Large files already make a reasonably sized batch; pass them through
+            if analysis.file_size >= pass_through_size:
+                batches.append(self._build_batch(len(batches) + 1, pool, [analysis], analysis.file_size))
+                continue
+            
             if (len(current_batch) >= max_batch_files or 
                 current_batch_size + analysis.file_size > max_batch_size):
                 
                 if current_batch:
-                    batches.append({
-                        'batch_id': len(batches) + 1,
-                        'files': [a.file_path for a in current_batch],
-                        'total_size': current_batch_size,
-                        'file_count': len(current_batch),
-                        'estimated_time': sum(a.estimated_import_time for a in current_batch)
-                    })
+                    batches.append(self._build_batch(len(batches) + 1, pool, current_batch, current_batch_size))
                 
                 current_batch = []
                 current_batch_size = 0
@@ -815,20 +1180,24 @@ class BulkFileAnalyzer:
         
         # Add final batch
         if current_batch:
-            batches.append({
-                'batch_id': len(batches) + 1,
-                'files': [a.file_path for a in current_batch],
-                'total_size': current_batch_size,
-                'file_count': len(current_batch),
-                'estimated_time': sum(a.estimated_import_time for a in current_batch)
-            })
-        
-        return batches
+            batches.append(self._build_batch(len(batches) + 1, pool, current_batch, current_batch_size))
+    
+    @staticmethod
+    def _build_batch(batch_id: int, pool: str, analyses: List[FileAnalysis], total_size: int) -> Batch:
+        """Build the output record for one processing batch"""
+        return Batch(
+            batch_id=batch_id,
+            priority_pool=pool,
+            files=[a.file_path for a in analyses],
+            total_size=total_size,
+            file_count=len(analyses),
+            estimated_time=sum(a.estimated_import_time for a in analyses)
+        )
     
     def _calculate_resource_requirements(self) -> Dict[str, Any]:
         """Calculate processing resource requirements"""
-        total_size = sum(a.file_size for a in self.file_analyses)
-        max_file_size = max(a.file_size for a in self.file_analyses) if self.file_analyses else 0
+        total_size = sum(self._sizes)
+        max_file_size = max(self._sizes, default=0)
         
         return {
             'memory_required_mb': max(512, max_file_size // (1024 * 1024) * 2),
@@ -842,15 +1211,13 @@ class BulkFileAnalyzer:
         if not self.file_analyses:
             return {'overall': 0.0}
         
-        confidence_scores = [a.analysis_confidence for a in self.file_analyses]
-        avg_confidence = sum(confidence_scores) / len(confidence_scores)
+        avg_confidence = sum(self._confidences) / len(self._confidences)
         
         # Content analysis coverage
-        content_analyzed = len([a for a in self.file_analyses if a.content_summary])
-        content_coverage = content_analyzed / len(self.file_analyses)
+        content_coverage = self._summarized_count / len(self.file_analyses)
         
         # Type classification accuracy
-        classified = len([a for a in self.file_analyses if a.content_type != 'other'])
+        classified = len(self.file_analyses) - self._content_type_counter['other']
         classification_rate = classified / len(self.file_analyses)
         
         return {
@@ -864,30 +1231,38 @@ class BulkFileAnalyzer:
         """Identify potential processing issues"""
         issues = []
         
+        # Count every per-file condition in a single pass
+        large_files = empty_files = encoding_issues = 0
+        for analysis in self.file_analyses:
+            file_size = analysis.file_size
+            if file_size > 100 * 1024 * 1024:
+                large_files += 1
+            elif file_size == 0:
+                empty_files += 1
+            
+            if analysis.content_type == 'document' and analysis.encoding is None:
+                encoding_issues += 1
+        
         # Large files
-        large_files = [a for a in self.file_analyses if a.file_size > 100 * 1024 * 1024]
         if large_files:
-            issues.append(f"{len(large_files)} files larger than 100MB may require special handling")
+            issues.append(f"{large_files} files larger than 100MB may require special handling")
         
         # Empty files
-        empty_files = [a for a in self.file_analyses if a.file_size == 0]
         if empty_files:
-            issues.append(f"{len(empty_files)} empty files detected")
+            issues.append(f"{empty_files} empty files detected")
         
         # Unknown file types
-        unknown_types = [a for a in self.file_analyses if a.content_type == 'other']
+        unknown_types = self._content_type_counter['other']
         if unknown_types:
-            issues.append(f"{len(unknown_types)} files with unknown content type")
+            issues.append(f"{unknown_types} files with unknown content type")
         
         # Encoding issues
-        encoding_issues = [a for a in self.file_analyses if a.encoding is None and a.content_type == 'document']
         if encoding_issues:
-            issues.append(f"{len(encoding_issues)} text files with unknown encoding")
+            issues.append(f"{encoding_issues} text files with unknown encoding")
         
         # Duplicate files
-        duplicates = self._detect_duplicates()
-        if duplicates:
-            total_duplicates = sum(len(group) - 1 for group in duplicates)
+        total_duplicates = self._detect_duplicates().total_redundant
+        if total_duplicates:
             issues.append(f"{total_duplicates} duplicate files detected")
         
         return issues
@@ -900,48 +1275,46 @@ class BulkFileAnalyzer:
         recommendations.append("Process high-priority files first to maximize early value")
         
         # Batch size optimization
-        avg_file_size = sum(a.file_size for a in self.file_analyses) / len(self.file_analyses)
+        avg_file_size = sum(self._sizes) / len(self._sizes) if self._sizes else 0
         if avg_file_size > 10 * 1024 * 1024:  # > 10MB
             recommendations.append("Use smaller batch sizes due to large average file size")
         
         # Content type specific recommendations
-        content_types = {}
-        for analysis in self.file_analyses:
-            content_types[analysis.content_type] = content_types.get(analysis.content_type, 0) + 1
+        content_types = self._content_type_counter
         
-        if content_types.get('document', 0) > 50:
+        if content_types['document'] > 50:
             recommendations.append("Consider parallel text extraction for document-heavy collection")
         
-        if content_types.get('image', 0) > 100:
+        if content_types['image'] > 100:
             recommendations.append("Implement image compression pipeline for large image collection")
         
         # Duplicate handling
-        duplicates = self._detect_duplicates()
-        if duplicates:
+        if self._detect_duplicates().groups:
             recommendations.append("Remove duplicates before import to save time and space")
         
         # Archive handling
-        archives = [a for a in self.file_analyses if a.content_type == 'archive']
-        if archives:
+        if content_types['archive']:
             recommendations.append("Extract and analyze archive contents before import")
         
         return recommendations
     
     def _save_analysis_results(self):
         """Save analysis results to files"""
-        # Save individual file analyses
-        file_analyses_data = [asdict(analysis) for analysis in self.file_analyses]
-        with open(self.output_directory / 'file_analyses.json', 'w') as f:
-            json.dump(file_analyses_data, f, indent=2, default=str)
+        # Written once from the in-memory list rather than streamed as each worker returns, and
+        # only after duplicate detection so the lazily computed digests are included
+        self._write_file_analyses()
         
         # Save collection analysis
         if self.collection_analysis:
-            with open(self.output_directory / 'collection_analysis.json', 'w') as f:
-                json.dump(asdict(self.collection_analysis), f, indent=2, default=str)
+            collection_path = self.output_directory / 'collection_analysis.json'
+            collection_path.write_bytes(_json_bytes(self.collection_analysis, indent=True))
         
         # Save summary report
         self._generate_summary_report()
         
+        # Only entries seen in this run are kept, so changed or removed files drop out
+        self._save_analysis_cache()
+        
         self.logger.info(f"Analysis results saved to {self.output_directory}")
     
     def _generate_summary_report(self):
@@ -961,8 +1334,12 @@ class BulkFileAnalyzer:
             "## Content Type Distribution",
         ]
         
-        for content_type, count in sorted(self.collection_analysis.content_types.items()):
-            percentage = (count / self.collection_analysis.total_files) * 100
+        # Percentage of the collection per file, computed once for both distributions
+        total_files = self.collection_analysis.total_files
+        percent_per_file = 100.0 / total_files if total_files else 0.0
+        
+        for content_type, count in self._content_type_counter.most_common():
+            percentage = count * percent_per_file
             report_lines.append(f"- {content_type.title()}: {count} files ({percentage:.1f}%)")
         
         report_lines.extend([
@@ -971,7 +1348,7 @@ class BulkFileAnalyzer:
         ])
         
         for size_range, count in self.collection_analysis.size_distribution.items():
-            percentage = (count / self.collection_analysis.total_files) * 100
+            percentage = count * percent_per_file
             report_lines.append(f"- {size_range.title()}: {count} files ({percentage:.1f}%)")
         
         report_lines.extend([
@@ -980,12 +1357,20 @@ class BulkFileAnalyzer:
             f"- Total Batches: {len(self.collection_analysis.processing_batches)}",
         ])
         
-        for batch in self.collection_analysis.processing_batches[:5]:  # Show first 5 batches
-            report_lines.append(
-                f"- Batch {batch['batch_id']}: {batch['file_count']} files, "
-                f"{batch['total_size'] / (1024*1024):.1f} MB, "
-                f"{batch['estimated_time'] / 60:.1f} minutes"
-            )
+        high_batches = sum(1 for batch in self.collection_analysis.processing_batches
+                           if batch.priority_pool == 'high')
+        low_batches = len(self.collection_analysis.processing_batches) - high_batches
+        report_lines.append(f"- Batches High: {high_batches}, Low: {low_batches}")
+        
+        # Batches are already in descending priority order, so the first 5 are the top 5
+        mb_per_byte = 1.0 / (1024 * 1024)
+        minutes_per_second = 1.0 / 60
+        report_lines.extend(
+            f"- Batch {batch.batch_id}: {batch.file_count} files, "
+            f"{batch.total_size * mb_per_byte:.1f} MB, "
+            f"{batch.estimated_time * minutes_per_second:.1f} minutes"
+            for batch in self.collection_analysis.processing_batches[:5]
+        )
         
         if len(self.collection_analysis.processing_batches) > 5:
             report_lines.append(f"- ... and {len(self.collection_analysis.processing_batches) - 5} more batches")
@@ -1010,6 +1395,18 @@ class BulkFileAnalyzer:
         with open(self.output_directory / 'summary_report.md', 'w') as f:
             f.write('\n'.join(report_lines))
 
+# Analyzer instance owned by each ProcessPoolExecutor worker
+_worker_analyzer: Optional[BulkFileAnalyzer] = None
+
+def _init_worker(target_directory: str, output_directory: str):
+    """Create the per-process analyzer used by pool workers"""
+    global _worker_analyzer
+    _worker_analyzer = BulkFileAnalyzer(target_directory, output_directory)
+
+def _analyze_in_worker(discovered: Tuple[Path, os.stat_result]) -> Tuple[Path, str, Optional[FileAnalysis], Optional[str]]:
+    """Analyze one file in a worker process"""
+    return _worker_analyzer._analyze_task(discovered)
+
 def main():
     """Main function for testing the bulk file analyzer"""
     import argparse
@@ -1017,6 +1414,8 @@ def main():
     parser = argparse.ArgumentParser(description='Analyze files for automated Notion import')
     parser.add_argument('target_directory', help='Directory containing files to analyze')
     parser.add_argument('--output', '-o', default='analysis_results', help='Output directory for results')
+    parser.add_argument('--workers', '-w', type=int, default=None, help='Number of analysis workers')
+    parser.add_argument('--processes', action='store_true', help='Analyze files in worker processes instead of threads')
     
     args = parser.parse_args()
     
@@ -1027,7 +1426,8 @@ def main():
     print(f"🔍 Starting bulk file analysis of: {args.target_directory}")
     print(f"📊 Results will be saved to: {args.output}")
     
-    analyzer = BulkFileAnalyzer(args.target_directory, args.output)
+    analyzer = BulkFileAnalyzer(args.target_directory, args.output,
+                                max_workers=args.workers, use_processes=args.processes)
     collection_analysis = analyzer.analyze_collection()
     
     print(f"\n✅ Analysis Complete!")
@@ -1042,9 +1442,10 @@ def main():
             print(f"   - {issue}")
     
     print(f"\n📋 Detailed results saved to: {args.output}/")
-    print(f"   - file_analyses.json: Individual file analysis")
+    print(f"   - file_analyses.jsonl: Individual file analysis (one JSON record per line)")
     print(f"   - collection_analysis.json: Overall collection analysis")
     print(f"   - summary_report.md: Human-readable summary")
+    print(f"   - analysis_cache.json: Reused on re-runs to skip unchanged files")
     
     return 0
 
@@ -13,16 +13,105 @@ Date: July 7, 2025
 """
 
 import os
+import sys
 import json
 import csv
+import hashlib
+import io
 import yaml
+import heapq
+import mmap
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
+from typing import Dict, List, Optional, Any, Tuple, Set
+from dataclasses import dataclass, field, fields, is_dataclass
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 import re
 
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sync.serialization import YamlDumper, orjson, ORJSON_AVAILABLE, load_yaml_config
+
+# xxHash fingerprints export blobs fastest; BLAKE2b with a short digest is the fallback
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+@lru_cache(maxsize=65536)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp once; tasks keep their timestamps across many scoring passes"""
+    # Router timestamps come from isoformat() and carry no 'Z'; only rewrite imported ones
+    # (fromisoformat accepts 'Z' itself only from Python 3.11)
+    if value[-1:] == 'Z':
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+def _shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """Map a dataclass's fields to a dict without asdict()'s recursive deep copy"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback serializer: enums by value, dataclasses as dicts, everything else as str"""
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return _shallow_asdict(value)
+    return str(value)
+
+# Shared by save_data so independent export writes overlap on disk
+_WRITE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='backlog-save')
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=_json_default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+
+def _blob_digest(blob: bytes) -> bytes:
+    """Short content fingerprint used to skip rewriting unchanged export files"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_digest(blob)
+    return hashlib.blake2b(blob, digest_size=8).digest()
+
+def _atomic_write(output_file: str, blob: bytes):
+    """Write bytes to a temp file and move it into place so readers never see a partial file"""
+    tmp_path = f"{output_file}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(blob)
+    os.replace(tmp_path, output_file)
+
+def _write_json(data: Any, output_file: str):
+    """Atomically write data as indented JSON"""
+    _atomic_write(output_file, _json_bytes(data))
+
+def _read_json(path: str) -> Any:
+    """Load a JSON file; orjson parses it straight from a read-only memory map"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return json.loads(b'')  # Raises the usual JSONDecodeError; empty files cannot be mapped
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if ORJSON_AVAILABLE:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+            return json.loads(mapped[:])
+
+def _coerce_enum(enum_cls, value: Any):
+    """Rebuild an enum from its value, accepting legacy 'EnumName.MEMBER' strings"""
+    if isinstance(value, enum_cls):
+        return value
+    prefix = f"{enum_cls.__name__}."
+    if isinstance(value, str) and value.startswith(prefix):
+        return enum_cls[value[len(prefix):]]
+    return enum_cls(value)
+
 class TaskPriority(Enum):
     """Task priority levels"""
     CRITICAL = "critical"
@@ -52,7 +141,32 @@ class TaskCategory(Enum):
     ENHANCEMENT = "enhancement"
     RESEARCH = "research"
 
-@dataclass
+# HLDD category/priority names mapped onto task enums
+HLDD_CATEGORY_MAP = {
+    'architecture': TaskCategory.ARCHITECTURE,
+    'security': TaskCategory.SECURITY,
+    'integration': TaskCategory.INTEGRATION,
+    'implementation': TaskCategory.IMPLEMENTATION,
+    'testing': TaskCategory.TESTING,
+    'documentation': TaskCategory.DOCUMENTATION,
+    'project_management': TaskCategory.PROJECT_MANAGEMENT,
+    'general': TaskCategory.IMPLEMENTATION
+}
+
+HLDD_PRIORITY_MAP = {
+    'critical': TaskPriority.CRITICAL,
+    'high': TaskPriority.HIGH,
+    'medium': TaskPriority.MEDIUM,
+    'low': TaskPriority.LOW
+}
+
+# Score boost for categories that should jump the queue
+CATEGORY_PRIORITY_BOOST = {
+    category._value_: 15 if category in (TaskCategory.SECURITY, TaskCategory.ARCHITECTURE) else 0
+    for category in TaskCategory
+}
+
+@dataclass(slots=True)
 class TaskItem:
     """Represents a single task item in the backlog"""
     id: str
@@ -75,8 +189,20 @@ class TaskItem:
     notion_page_id: Optional[str] = None
     manus_task_id: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'TaskItem':
+        """Rebuild a task from its serialized JSON form"""
+        data = dict(data)
+        data['category'] = _coerce_enum(TaskCategory, data['category'])
+        data['priority'] = _coerce_enum(TaskPriority, data['priority'])
+        data['status'] = _coerce_enum(TaskStatus, data['status'])
+        return cls(**data)
+
+# TaskItem field names in declaration order, as written to the task export
+_TASK_FIELD_NAMES = tuple(f.name for f in fields(TaskItem))
 
-@dataclass
+@dataclass(slots=True)
 class Sprint:
     """Represents a development sprint"""
     id: str
@@ -89,7 +215,7 @@ class Sprint:
     goals: List[str] = field(default_factory=list)
     retrospective_notes: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     """Represents a team member"""
     id: str
@@ -105,17 +231,36 @@ class BacklogTaskRouter:
     
     def __init__(self, config_path: str = "backlog_config.yaml"):
         self.config_path = config_path
-        self.config = self._load_config()
         self.logger = self._setup_logging()
+        self.config = self._load_config()
         
         # Task storage
         self.tasks: Dict[str, TaskItem] = {}
         self.sprints: Dict[str, Sprint] = {}
         self.team_members: Dict[str, TeamMember] = {}
         
+        # Serialized task records keyed by a snapshot of the task's field values, so a save
+        # only rebuilds records for tasks whose fields were reassigned since the last one
+        self._serialized_tasks: Dict[str, Tuple[Tuple[Any, ...], Dict[str, Any]]] = {}
+        
+        # Fingerprint of the bytes last written to each export path by save_data
+        self._written_digests: Dict[str, bytes] = {}
+        
+        # Per-category min-heaps of (workload, rule order, member id) for auto-assignment
+        self._assign_heaps: Dict[str, List[Tuple[int, int, str]]] = {}
+        
+        # Configured priority weights resolved for every priority, so scoring is a plain subscript
+        configured_weights = self.config.get('priority_weights', {})
+        self._priority_weights: Dict[str, float] = {
+            priority._value_: configured_weights.get(priority._value_, 50) for priority in TaskPriority
+        }
+        
         # Routing rules
         self.routing_rules = self._initialize_routing_rules()
         
+        # Data and export directory, created once rather than before every write
+        os.makedirs("tasks", exist_ok=True)
+        
         # Load existing data
         self._load_existing_data()
     
@@ -123,8 +268,7 @@ class BacklogTaskRouter:
         """Load backlog configuration"""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f)
+                return load_yaml_config(self.config_path, self.logger)
             else:
                 default_config = {
                     'team_members': [
@@ -172,7 +316,7 @@ class BacklogTaskRouter:
                 }
                 
                 with open(self.config_path, 'w') as f:
-                    yaml.dump(default_config, f, default_flow_style=False)
+                    yaml.dump(default_config, f, Dumper=YamlDumper, default_flow_style=False)
                 
                 return default_config
         except Exception as e:
@@ -224,18 +368,16 @@ class BacklogTaskRouter:
             # Load tasks
             tasks_file = "tasks/backlog_tasks.json"
             if os.path.exists(tasks_file):
-                with open(tasks_file, 'r') as f:
-                    tasks_data = json.load(f)
+                tasks_data = _read_json(tasks_file)
                 
                 for task_data in tasks_data:
-                    task = TaskItem(**task_data)
+                    task = TaskItem.from_dict(task_data)
                     self.tasks[task.id] = task
             
             # Load sprints
             sprints_file = "tasks/sprints.json"
             if os.path.exists(sprints_file):
-                with open(sprints_file, 'r') as f:
-                    sprints_data = json.load(f)
+                sprints_data = _read_json(sprints_file)
                 
                 for sprint_data in sprints_data:
                     sprint = Sprint(**sprint_data)
@@ -254,9 +396,10 @@ class BacklogTaskRouter:
     def import_hldd_actionable_items(self, actionable_items_file: str) -> int:
         """Import actionable items from HLDD processing"""
         try:
-            with open(actionable_items_file, 'r') as f:
-                actionable_items = json.load(f)
+            actionable_items = _read_json(actionable_items_file)
             
+            # One timestamp for the whole import batch
+            now_iso = datetime.now().isoformat()
             imported_count = 0
             
             for item in actionable_items:
@@ -281,13 +424,15 @@ class BacklogTaskRouter:
                     category=category,
                     priority=priority,
                     status=TaskStatus.PENDING,
+                    created_at=now_iso,
+                    updated_at=now_iso,
                     source_section=item['section_id'],
                     tags=['hldd', 'imported'],
                     metadata={
                         'source_file': 'HLDD',
                         'section_title': item['section_title'],
                         'source_line': item.get('source_line'),
-                        'import_date': datetime.now().isoformat()
+                        'import_date': now_iso
                     }
                 )
                 
@@ -301,31 +446,52 @@ class BacklogTaskRouter:
             self.logger.error(f"Error importing HLDD actionable items: {e}")
             return 0
     
+    def _append_task_item(self, task_id: str, field_name: str, value: str):
+        """Append to a task's tags/dependencies/blockers, skipping values already present"""
+        items = getattr(self.tasks[task_id], field_name)
+        if value not in items:
+            items.append(value)
+    
+    def add_task_tag(self, task_id: str, tag: str):
+        """Tag a task"""
+        self._append_task_item(task_id, 'tags', tag)
+    
+    def add_task_dependency(self, task_id: str, dependency_id: str):
+        """Record that a task depends on another task"""
+        self._append_task_item(task_id, 'dependencies', dependency_id)
+    
+    def add_task_blocker(self, task_id: str, blocker: str):
+        """Record a blocker on a task"""
+        self._append_task_item(task_id, 'blockers', blocker)
+    
+    def update_task_metadata(self, task_id: str, **values: Any):
+        """Merge values into a task's metadata"""
+        self.tasks[task_id].metadata.update(values)
+    
+    def _task_records(self) -> List[Dict[str, Any]]:
+        """Serialized task records in task order, re-converting only tasks whose fields changed"""
+        cached = self._serialized_tasks
+        current = {}
+        for task_id, task in self.tasks.items():
+            # Records share the task's containers, so in-place list/dict edits need no rebuild;
+            # any reassigned field, set directly or through the router, changes the snapshot
+            snapshot = tuple(getattr(task, name) for name in _TASK_FIELD_NAMES)
+            entry = cached.get(task_id)
+            if entry is None or entry[0] != snapshot:
+                entry = (snapshot, dict(zip(_TASK_FIELD_NAMES, snapshot)))
+            current[task_id] = entry
+        
+        # Drop records for tasks that are no longer in the backlog
+        self._serialized_tasks = current
+        return [record for _, record in current.values()]
+    
     def _map_hldd_category_to_task_category(self, hldd_category: str) -> TaskCategory:
         """Map HLDD category to task category"""
-        mapping = {
-            'architecture': TaskCategory.ARCHITECTURE,
-            'security': TaskCategory.SECURITY,
-            'integration': TaskCategory.INTEGRATION,
-            'implementation': TaskCategory.IMPLEMENTATION,
-            'testing': TaskCategory.TESTING,
-            'documentation': TaskCategory.DOCUMENTATION,
-            'project_management': TaskCategory.PROJECT_MANAGEMENT,
-            'general': TaskCategory.IMPLEMENTATION
-        }
-        
-        return mapping.get(hldd_category, TaskCategory.IMPLEMENTATION)
+        return HLDD_CATEGORY_MAP.get(hldd_category, TaskCategory.IMPLEMENTATION)
     
     def _map_hldd_priority_to_task_priority(self, hldd_priority: str) -> TaskPriority:
         """Map HLDD priority to task priority"""
-        mapping = {
-            'critical': TaskPriority.CRITICAL,
-            'high': TaskPriority.HIGH,
-            'medium': TaskPriority.MEDIUM,
-            'low': TaskPriority.LOW
-        }
-        
-        return mapping.get(hldd_priority, TaskPriority.MEDIUM)
+        return HLDD_PRIORITY_MAP.get(hldd_priority, TaskPriority.MEDIUM)
     
     def create_task(self, title: str, description: str, category: TaskCategory, 
                    priority: TaskPriority, **kwargs) -> TaskItem:
@@ -354,74 +520,85 @@ class BacklogTaskRouter:
     def _auto_assign_task(self, task: TaskItem):
         """Automatically assign task based on category and team capacity"""
         try:
-            # Get potential assignees for this category
-            category_key = task.category.value
-            potential_assignees = self.config.get('auto_assignment_rules', {}).get(category_key, [])
-            
-            if not potential_assignees:
-                return
+            # Least-loaded skilled assignee for this category; ties go to rule order
+            category_key = task.category._value_
+            heap = self._assignment_heap(category_key)
             
-            # Find best assignee based on capacity and skills
-            best_assignee = None
-            min_workload = float('inf')
-            
-            for assignee_id in potential_assignees:
-                if assignee_id in self.team_members:
-                    member = self.team_members[assignee_id]
-                    
-                    # Calculate current workload
-                    current_workload = len(member.current_tasks)
-                    
-                    # Check if member has relevant skills
-                    has_relevant_skills = any(skill in member.skills for skill in [category_key, 'general'])
-                    
-                    if has_relevant_skills and current_workload < min_workload:
-                        best_assignee = assignee_id
-                        min_workload = current_workload
-            
-            if best_assignee:
+            while heap:
+                workload, rule_order, best_assignee = heap[0]
+                member = self.team_members[best_assignee]
+                
+                # Workloads only grow, so a stale entry is refreshed and the heap re-checked
+                current_workload = len(member.current_tasks)
+                if workload != current_workload:
+                    heapq.heapreplace(heap, (current_workload, rule_order, best_assignee))
+                    continue
+                
                 task.assignee = best_assignee
-                self.team_members[best_assignee].current_tasks.append(task.id)
+                member.current_tasks.append(task.id)
+                heapq.heapreplace(heap, (current_workload + 1, rule_order, best_assignee))
                 self.logger.info(f"Auto-assigned task {task.id} to {best_assignee}")
+                break
         
         except Exception as e:
             self.logger.error(f"Error in auto-assignment: {e}")
     
-    def prioritize_backlog(self) -> List[TaskItem]:
-        """Prioritize backlog based on multiple factors"""
-        tasks = list(self.tasks.values())
+    def _priority_score(self, task: TaskItem, now: datetime) -> float:
+        """Score a task for prioritization (higher is more urgent)"""
+        score = 0
         
-        def priority_score(task: TaskItem) -> float:
-            score = 0
-            
-            # Base priority weight
-            priority_weights = self.config.get('priority_weights', {})
-            score += priority_weights.get(task.priority.value, 50)
-            
-            # Age factor (older tasks get higher priority)
-            created_date = datetime.fromisoformat(task.created_at.replace('Z', '+00:00'))
-            age_days = (datetime.now() - created_date).days
-            score += age_days * 2
-            
-            # Dependency factor (tasks with no dependencies get higher priority)
-            if not task.dependencies:
-                score += 10
-            
-            # Blocker factor (blocked tasks get lower priority)
-            if task.blockers:
-                score -= 20
-            
-            # Category factor (critical categories get boost)
-            critical_categories = [TaskCategory.SECURITY, TaskCategory.ARCHITECTURE]
-            if task.category in critical_categories:
-                score += 15
+        # Base priority weight
+        score += self._priority_weights[task.priority._value_]
+        
+        # Age factor (older tasks get higher priority)
+        age_days = (now - _parse_timestamp(task.created_at)).days
+        score += age_days * 2
+        
+        # Dependency factor (tasks with no dependencies get higher priority)
+        if not task.dependencies:
+            score += 10
+        
+        # Blocker factor (blocked tasks get lower priority)
+        if task.blockers:
+            score -= 20
+        
+        # Category factor (critical categories get boost)
+        score += CATEGORY_PRIORITY_BOOST[task.category._value_]
+        
+        return score
+    
+    def _priority_heap(self, tasks: List[TaskItem]) -> List[Tuple[float, int, TaskItem]]:
+        """Build a max-priority heap; the sequence number keeps ties in backlog order"""
+        now = datetime.now()
+        heap = [(-self._priority_score(task, now), seq, task)
+                for seq, task in enumerate(tasks)]
+        heapq.heapify(heap)
+        return heap
+    
+    def _assignment_heap(self, category_key: str) -> List[Tuple[int, int, str]]:
+        """Workload heap of the skilled assignees for a category, built on first use"""
+        heap = self._assign_heaps.get(category_key)
+        if heap is None:
+            potential_assignees = self.config.get('auto_assignment_rules', {}).get(category_key, [])
+            heap = []
+            for rule_order, assignee_id in enumerate(potential_assignees):
+                member = self.team_members.get(assignee_id)
+                
+                # Skills are checked once here rather than on every assignment
+                if member and (category_key in member.skills or 'general' in member.skills):
+                    heap.append((len(member.current_tasks), rule_order, assignee_id))
             
-            return score
+            heapq.heapify(heap)
+            self._assign_heaps[category_key] = heap
+        return heap
+    
+    def prioritize_backlog(self) -> List[TaskItem]:
+        """Prioritize backlog based on multiple factors"""
+        heap = self._priority_heap(list(self.tasks.values()))
         
         # Sort by priority score (descending)
-        prioritized_tasks = sorted(tasks, key=priority_score, reverse=True)
-        
-        return prioritized_tasks
+        heap.sort()
+        return [task for _, _, task in heap]
     
     def create_sprint(self, name: str, start_date: str, end_date: str, 
                      capacity_hours: float, goals: List[str] = None) -> Sprint:
@@ -450,30 +627,33 @@ class BacklogTaskRouter:
         sprint = self.sprints[sprint_id]
         
         if auto_select_tasks:
-            # Get prioritized backlog
-            prioritized_tasks = self.prioritize_backlog()
-            
             # Filter available tasks (pending status, no blockers)
             available_tasks = [
-                task for task in prioritized_tasks
+                task for task in self.tasks.values()
                 if task.status == TaskStatus.PENDING and not task.blockers
             ]
             
+            # Pop tasks in priority order only until nothing else can fit
+            prioritized_tasks = self._priority_heap(available_tasks)
+            
             # Select tasks for sprint based on capacity
             selected_tasks = []
             total_hours = 0
             capacity_with_buffer = sprint.capacity_hours * 0.8  # 20% buffer
+            min_hours = min((task.estimated_hours or 8 for task in available_tasks), default=0)
             
-            for task in available_tasks:
+            while prioritized_tasks and capacity_with_buffer - total_hours >= min_hours:
+                task = heapq.heappop(prioritized_tasks)[2]
                 estimated_hours = task.estimated_hours or 8  # Default 8 hours
                 
                 if total_hours + estimated_hours <= capacity_with_buffer:
                     selected_tasks.append(task)
                     total_hours += estimated_hours
-                    
-                    # Update task status and sprint assignment
-                    task.status = TaskStatus.IN_PROGRESS
-                    sprint.tasks.append(task.id)
+            
+            # Update task status and sprint assignment in one pass once selection is settled
+            for task in selected_tasks:
+                task.status = TaskStatus.IN_PROGRESS
+            sprint.tasks.extend(task.id for task in selected_tasks)
             
             self.logger.info(f"Auto-selected {len(selected_tasks)} tasks for sprint {sprint_id}")
         
@@ -499,101 +679,111 @@ class BacklogTaskRouter:
     
     def _analyze_sprint_tasks_by_category(self, sprint: Sprint) -> Dict[str, int]:
         """Analyze sprint tasks by category"""
-        category_counts = {}
-        
-        for task_id in sprint.tasks:
-            if task_id in self.tasks:
-                category = self.tasks[task_id].category.value
-                category_counts[category] = category_counts.get(category, 0) + 1
-        
-        return category_counts
+        return dict(Counter(
+            self.tasks[task_id].category._value_ for task_id in sprint.tasks if task_id in self.tasks
+        ))
     
     def _analyze_sprint_tasks_by_assignee(self, sprint: Sprint) -> Dict[str, int]:
         """Analyze sprint tasks by assignee"""
-        assignee_counts = {}
-        
-        for task_id in sprint.tasks:
-            if task_id in self.tasks:
-                assignee = self.tasks[task_id].assignee or 'unassigned'
-                assignee_counts[assignee] = assignee_counts.get(assignee, 0) + 1
-        
-        return assignee_counts
+        return dict(Counter(
+            self.tasks[task_id].assignee or 'unassigned' for task_id in sprint.tasks if task_id in self.tasks
+        ))
+    
+    @staticmethod
+    def _ensure_output_dir(output_file: str):
+        """Create the parent of a custom export path; the tasks directory exists from __init__"""
+        output_dir = os.path.dirname(output_file)
+        if output_dir and output_dir != "tasks":
+            os.makedirs(output_dir, exist_ok=True)
     
     def generate_roadmap_csv(self, output_file: str = "tasks/roadmap.csv"):
         """Generate roadmap CSV for external tools"""
         try:
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'Task ID', 'Title', 'Description', 'Category', 'Priority', 
-                    'Status', 'Assignee', 'Estimated Hours', 'Due Date',
-                    'Created Date', 'Updated Date', 'Tags', 'Dependencies',
-                    'Source Section', 'Notion Page ID', 'Manus Task ID'
-                ]
-                
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for task in self.tasks.values():
-                    writer.writerow({
-                        'Task ID': task.id,
-                        'Title': task.title,
-                        'Description': task.description,
-                        'Category': task.category.value,
-                        'Priority': task.priority.value,
-                        'Status': task.status.value,
-                        'Assignee': task.assignee or '',
-                        'Estimated Hours': task.estimated_hours or '',
-                        'Due Date': task.due_date or '',
-                        'Created Date': task.created_at,
-                        'Updated Date': task.updated_at,
-                        'Tags': ', '.join(task.tags),
-                        'Dependencies': ', '.join(task.dependencies),
-                        'Source Section': task.source_section or '',
-                        'Notion Page ID': task.notion_page_id or '',
-                        'Manus Task ID': task.manus_task_id or ''
-                    })
+            self._ensure_output_dir(output_file)
+            _atomic_write(output_file, self._roadmap_csv_bytes())
             
             self.logger.info(f"Generated roadmap CSV: {output_file}")
             
         except Exception as e:
             self.logger.error(f"Error generating roadmap CSV: {e}")
     
+    def _roadmap_csv_bytes(self) -> bytes:
+        """Render the roadmap CSV as UTF-8 bytes"""
+        with io.StringIO(newline='') as csvfile:
+            fieldnames = [
+                'Task ID', 'Title', 'Description', 'Category', 'Priority', 
+                'Status', 'Assignee', 'Estimated Hours', 'Due Date',
+                'Created Date', 'Updated Date', 'Tags', 'Dependencies',
+                'Source Section', 'Notion Page ID', 'Manus Task ID'
+            ]
+            
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            
+            # Rows as tuples in fieldnames order, written in one C-level call
+            writer.writerows(
+                (
+                    task.id,
+                    task.title,
+                    task.description,
+                    task.category._value_,
+                    task.priority._value_,
+                    task.status._value_,
+                    task.assignee or '',
+                    task.estimated_hours or '',
+                    task.due_date or '',
+                    task.created_at,
+                    task.updated_at,
+                    ', '.join(task.tags),
+                    ', '.join(task.dependencies),
+                    task.source_section or '',
+                    task.notion_page_id or '',
+                    task.manus_task_id or ''
+                )
+                for task in self.tasks.values()
+            )
+            
+            return csvfile.getvalue().encode('utf-8')
+    
     def generate_backlog_json(self, output_file: str = "tasks/AI-Backlog.json"):
         """Generate AI-readable backlog JSON"""
         try:
-            os.makedirs(os.path.dirname(output_file), exist_ok=True)
-            
-            backlog_data = {
-                'metadata': {
-                    'generated_at': datetime.now().isoformat(),
-                    'total_tasks': len(self.tasks),
-                    'total_sprints': len(self.sprints),
-                    'team_members': len(self.team_members)
-                },
-                'tasks': [asdict(task) for task in self.tasks.values()],
-                'sprints': [asdict(sprint) for sprint in self.sprints.values()],
-                'team_members': [asdict(member) for member in self.team_members.values()],
-                'routing_rules': self.routing_rules,
-                'statistics': self._generate_backlog_statistics()
-            }
-            
-            with open(output_file, 'w') as f:
-                json.dump(backlog_data, f, indent=2, default=str)
+            self._ensure_output_dir(output_file)
+            _atomic_write(output_file, self._backlog_json_bytes())
             
             self.logger.info(f"Generated AI backlog JSON: {output_file}")
             
         except Exception as e:
             self.logger.error(f"Error generating backlog JSON: {e}")
     
+    def _backlog_json_bytes(self) -> bytes:
+        """Render the AI-readable backlog JSON as bytes"""
+        backlog_data = {
+            'metadata': {
+                'generated_at': datetime.now().isoformat(),
+                'total_tasks': len(self.tasks),
+                'total_sprints': len(self.sprints),
+                'team_members': len(self.team_members)
+            },
+            'tasks': self._task_records(),
+            'sprints': list(self.sprints.values()),
+            'team_members': list(self.team_members.values()),
+            'routing_rules': self.routing_rules,
+            'statistics': self._generate_backlog_statistics()
+        }
+        
+        return _json_bytes(backlog_data)
+    
     def _generate_backlog_statistics(self) -> Dict[str, Any]:
         """Generate backlog statistics"""
+        tasks = self.tasks.values()
+        
+        # Distributions, each counted in C by Counter
         stats = {
-            'tasks_by_status': {},
-            'tasks_by_priority': {},
-            'tasks_by_category': {},
-            'tasks_by_assignee': {},
+            'tasks_by_status': dict(Counter(task.status._value_ for task in tasks)),
+            'tasks_by_priority': dict(Counter(task.priority._value_ for task in tasks)),
+            'tasks_by_category': dict(Counter(task.category._value_ for task in tasks)),
+            'tasks_by_assignee': dict(Counter(task.assignee or 'unassigned' for task in tasks)),
             'average_task_age_days': 0,
             'overdue_tasks': 0,
             'blocked_tasks': 0
@@ -602,35 +792,14 @@ class BacklogTaskRouter:
         total_age_days = 0
         current_date = datetime.now()
         
-        for task in self.tasks.values():
-            # Status distribution
-            status = task.status.value
-            stats['tasks_by_status'][status] = stats['tasks_by_status'].get(status, 0) + 1
-            
-            # Priority distribution
-            priority = task.priority.value
-            stats['tasks_by_priority'][priority] = stats['tasks_by_priority'].get(priority, 0) + 1
+        # Age, overdue and blocked counts in one pass over cached timestamps
+        for task in tasks:
+            total_age_days += (current_date - _parse_timestamp(task.created_at)).days
             
-            # Category distribution
-            category = task.category.value
-            stats['tasks_by_category'][category] = stats['tasks_by_category'].get(category, 0) + 1
-            
-            # Assignee distribution
-            assignee = task.assignee or 'unassigned'
-            stats['tasks_by_assignee'][assignee] = stats['tasks_by_assignee'].get(assignee, 0) + 1
-            
-            # Age calculation
-            created_date = datetime.fromisoformat(task.created_at.replace('Z', '+00:00'))
-            age_days = (current_date - created_date).days
-            total_age_days += age_days
-            
-            # Overdue tasks
-            if task.due_date:
-                due_date = datetime.fromisoformat(task.due_date.replace('Z', '+00:00'))
-                if current_date > due_date and task.status != TaskStatus.COMPLETED:
+            if task.due_date and task.status != TaskStatus.COMPLETED:
+                if current_date > _parse_timestamp(task.due_date):
                     stats['overdue_tasks'] += 1
             
-            # Blocked tasks
             if task.blockers:
                 stats['blocked_tasks'] += 1
         
@@ -642,21 +811,25 @@ class BacklogTaskRouter:
     def save_data(self):
         """Save all data to files"""
         try:
-            os.makedirs("tasks", exist_ok=True)
-            
-            # Save tasks
-            tasks_data = [asdict(task) for task in self.tasks.values()]
-            with open("tasks/backlog_tasks.json", 'w') as f:
-                json.dump(tasks_data, f, indent=2, default=str)
+            # Serialize everything up front, then write the independent files concurrently
+            blobs = {
+                "tasks/backlog_tasks.json": _json_bytes(self._task_records()),
+                "tasks/sprints.json": _json_bytes(list(self.sprints.values())),
+                "tasks/roadmap.csv": self._roadmap_csv_bytes(),
+                "tasks/AI-Backlog.json": self._backlog_json_bytes()
+            }
             
-            # Save sprints
-            sprints_data = [asdict(sprint) for sprint in self.sprints.values()]
-            with open("tasks/sprints.json", 'w') as f:
-                json.dump(sprints_data, f, indent=2, default=str)
+            # Skip files whose content is byte-for-byte what this router last wrote there
+            digests = {path: _blob_digest(blob) for path, blob in blobs.items()}
+            changed = [
+                path for path, digest in digests.items()
+                if self._written_digests.get(path) != digest or not os.path.exists(path)
+            ]
             
-            # Generate exports
-            self.generate_roadmap_csv()
-            self.generate_backlog_json()
+            writes = {path: _WRITE_POOL.submit(_atomic_write, path, blobs[path]) for path in changed}
+            for path, write in writes.items():
+                write.result()
+                self._written_digests[path] = digests[path]
             
             self.logger.info("All backlog data saved successfully")
             
@@ -14,13 +14,192 @@ Date: July 7, 2025
 
 import os
 import re
+import sys
 import json
 import yaml
+import copy
+import mmap
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields, is_dataclass
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+# tomllib (Python 3.11+) reads TOML configs with no third-party parser
+try:
+    import tomllib
+    TOMLLIB_AVAILABLE = True
+except ImportError:
+    TOMLLIB_AVAILABLE = False
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sync.serialization import YamlLoader, YamlDumper, orjson, ORJSON_AVAILABLE
+
+# Markdown ATX header: hashes, then the title. Matched across a whole document, so the
+# separating whitespace must not run on into the next line
+HEADER_PATTERN = re.compile(r'^(#{1,6})[^\S\n]+(.+)$', re.MULTILINE)
+
+# Patterns for identifying actionable content, compiled once for every line scanned
+TASK_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'TODO:?\s*(.+)',
+        r'Action:?\s*(.+)',
+        r'Task:?\s*(.+)',
+        r'Implementation:?\s*(.+)',
+        r'Next steps?:?\s*(.+)',
+        r'Requirements?:?\s*(.+)'
+    )
+)
+
+# Lines mentioning any task keyword; only these are run through TASK_PATTERNS
+TASK_LINE_PATTERN = re.compile(
+    r'^.*?(?:TODO|Action|Task|Implementation|Next step|Requirement)',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Semantic patterns for content classification
+SECTION_PATTERNS = {
+    'architecture': [
+        r'architecture', r'system design', r'technical architecture',
+        r'component design', r'infrastructure', r'framework'
+    ],
+    'security': [
+        r'security', r'authentication', r'authorization', r'encryption',
+        r'compliance', r'audit', r'privacy', r'protection'
+    ],
+    'integration': [
+        r'integration', r'api', r'interface', r'connector',
+        r'middleware', r'bridge', r'sync', r'communication'
+    ],
+    'implementation': [
+        r'implementation', r'development', r'coding', r'deployment',
+        r'installation', r'setup', r'configuration'
+    ],
+    'testing': [
+        r'testing', r'validation', r'verification', r'qa',
+        r'quality assurance', r'test cases', r'scenarios'
+    ],
+    'documentation': [
+        r'documentation', r'specification', r'requirements',
+        r'user guide', r'manual', r'reference'
+    ],
+    'project_management': [
+        r'project', r'timeline', r'milestone', r'task',
+        r'schedule', r'planning', r'roadmap', r'backlog'
+    ]
+}
+
+# One anchored regex classifies a title in a single match: each category is a lookahead
+# tried in table order, so the first category with any keyword wins (not the leftmost
+# keyword), and an empty named group reports which one matched via lastgroup
+CATEGORY_PATTERN = re.compile(
+    '^(?:' + '|'.join(
+        f"(?=.*?(?:{'|'.join(patterns)}))(?P<{category}>)"
+        for category, patterns in SECTION_PATTERNS.items()
+    ) + ')',
+    re.IGNORECASE | re.DOTALL
+)
+
+@lru_cache(maxsize=4096)
+def _classify_title(title: str) -> str:
+    """Category for a section title; titles like "Overview" recur across documents"""
+    match = CATEGORY_PATTERN.match(title)
+    return match.lastgroup if match else 'general'
+
+# Headers and task-candidate lines in a single scan of a document; group 1 is set only
+# for headers, so header lines are never taken as task lines
+DOCUMENT_PATTERN = re.compile(
+    r'^(?:(#{1,6})[^\S\n]+(.+)$|.*?(?:TODO|Action|Task|Implementation|Next step|Requirement))',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Whitespace that str.strip() would remove from the front of a section body
+LEADING_WHITESPACE = re.compile(r'\s*')
+
+# Task priority keywords, matched as substrings of the lowercased description
+HIGH_PRIORITY_KEYWORDS = (
+    'critical', 'urgent', 'immediate', 'asap', 'priority',
+    'security', 'bug', 'fix', 'error', 'issue'
+)
+
+MEDIUM_PRIORITY_KEYWORDS = (
+    'important', 'should', 'recommended', 'enhancement',
+    'improvement', 'optimization'
+)
+
+# One match per description; the high lookahead is tried first so any high keyword
+# outranks a medium one wherever it appears
+PRIORITY_PATTERN = re.compile(
+    '^(?:'
+    f"(?=.*?(?:{'|'.join(map(re.escape, HIGH_PRIORITY_KEYWORDS))}))(?P<high>)"
+    f"|(?=.*?(?:{'|'.join(map(re.escape, MEDIUM_PRIORITY_KEYWORDS))}))(?P<medium>)"
+    ')',
+    re.DOTALL
+)
+
+def _read_markdown(file_path: str) -> str:
+    """Decode a UTF-8 document straight from a read-only memory map, with universal newlines"""
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''  # Empty files cannot be mapped
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(mapped, 'utf-8')
+    
+    # Same newline translation as opening the file in text mode
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def _stripped_slice(text: str, start: int, end: int) -> str:
+    """text[start:end].strip() as a single slice, without first copying the unstripped body"""
+    start = LEADING_WHITESPACE.match(text, start, end).end()
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start:end]
+
+def _shallow_asdict(obj: Any) -> Dict[str, Any]:
+    """Map a dataclass's fields to a dict without asdict()'s recursive deep copy"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback serializer: dataclasses as dicts, everything else as str"""
+    if is_dataclass(value):
+        return _shallow_asdict(value)
+    return str(value)
+
+def _write_json(data: Any, output_path: str, default=None):
+    """Write data as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, default=default,
+                                 option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(data, f, indent=2, default=default)
+
+def _read_json(input_path: str) -> Any:
+    """Load a JSON file, using orjson when available"""
+    with open(input_path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+@lru_cache(maxsize=32)
+def _parse_config_file(config_path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON, TOML or YAML config once per (path, mtime, size); callers get their own copy"""
+    extension = os.path.splitext(config_path)[1].lower()
+    if extension == '.json':
+        return _read_json(config_path)
+    if extension == '.toml':
+        with open(config_path, 'rb') as f:
+            return tomllib.load(f)
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
 
 @dataclass
 class HLDDSection:
@@ -42,6 +221,19 @@ class HLDDSection:
             self.metadata = {}
         if self.last_updated is None:
             self.last_updated = datetime.now().isoformat()
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'HLDDSection':
+        """Rebuild a section from its serialized JSON form"""
+        # Complete records, as save_mapping_to_file writes them, skip __init__/__post_init__
+        if (data.keys() == _SECTION_FIELD_NAMES and data['subsections'] is not None
+                and data['metadata'] is not None and data['last_updated'] is not None):
+            section = cls.__new__(cls)
+            section.__dict__.update(data)
+            return section
+        return cls(**data)
+
+_SECTION_FIELD_NAMES = frozenset(f.name for f in fields(HLDDSection))
 
 @dataclass
 class HLDDMapping:
@@ -60,40 +252,11 @@ class HLDDSemanticMapper:
     
     def __init__(self, config_path: str = "hldd_mapping_config.yaml"):
         self.config_path = config_path
-        self.config = self._load_config()
         self.logger = self._setup_logging()
+        self.config = self._load_config()
         
         # Semantic patterns for content classification
-        self.section_patterns = {
-            'architecture': [
-                r'architecture', r'system design', r'technical architecture',
-                r'component design', r'infrastructure', r'framework'
-            ],
-            'security': [
-                r'security', r'authentication', r'authorization', r'encryption',
-                r'compliance', r'audit', r'privacy', r'protection'
-            ],
-            'integration': [
-                r'integration', r'api', r'interface', r'connector',
-                r'middleware', r'bridge', r'sync', r'communication'
-            ],
-            'implementation': [
-                r'implementation', r'development', r'coding', r'deployment',
-                r'installation', r'setup', r'configuration'
-            ],
-            'testing': [
-                r'testing', r'validation', r'verification', r'qa',
-                r'quality assurance', r'test cases', r'scenarios'
-            ],
-            'documentation': [
-                r'documentation', r'specification', r'requirements',
-                r'user guide', r'manual', r'reference'
-            ],
-            'project_management': [
-                r'project', r'timeline', r'milestone', r'task',
-                r'schedule', r'planning', r'roadmap', r'backlog'
-            ]
-        }
+        self.section_patterns = SECTION_PATTERNS
         
         # Notion page templates for different content types
         self.notion_templates = {
@@ -158,9 +321,11 @@ class HLDDSemanticMapper:
     def _load_config(self) -> Dict[str, Any]:
         """Load HLDD mapping configuration"""
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f)
+            config_file = self._find_config_file()
+            if config_file:
+                stat = os.stat(config_file)
+                config = _parse_config_file(config_file, stat.st_mtime_ns, stat.st_size)
+                return copy.deepcopy(config)
             else:
                 # Create default configuration
                 default_config = {
@@ -187,13 +352,33 @@ class HLDDSemanticMapper:
                 }
                 
                 with open(self.config_path, 'w') as f:
-                    yaml.dump(default_config, f, default_flow_style=False)
+                    yaml.dump(default_config, f, Dumper=YamlDumper, default_flow_style=False)
                 
                 return default_config
         except Exception as e:
             self.logger.error(f"Error loading HLDD mapping config: {e}")
             return {}
     
+    def _find_config_file(self) -> Optional[str]:
+        """Use the YAML config unless a JSON (then TOML) sibling has been modified more recently"""
+        base_path = os.path.splitext(self.config_path)[0]
+        siblings = [f"{base_path}.json"]
+        if TOMLLIB_AVAILABLE:
+            siblings.append(f"{base_path}.toml")
+        
+        chosen_path = self.config_path if os.path.exists(self.config_path) else None
+        chosen_mtime = os.path.getmtime(chosen_path) if chosen_path else None
+        for sibling in siblings:
+            if not os.path.exists(sibling):
+                continue
+            sibling_mtime = os.path.getmtime(sibling)
+            if chosen_mtime is None or sibling_mtime > chosen_mtime:
+                chosen_path, chosen_mtime = sibling, sibling_mtime
+        
+        if chosen_path:
+            self.logger.info(f"Loading HLDD mapping config from {chosen_path}")
+        return chosen_path
+    
     def _setup_logging(self) -> logging.Logger:
         """Setup logging for the HLDD mapper"""
         logger = logging.getLogger('hldd_mapper')
@@ -209,54 +394,28 @@ class HLDDSemanticMapper:
         
         return logger
     
-    def parse_hldd_document(self, file_path: str) -> List[HLDDSection]:
+    def parse_hldd_document(self, file_path: str, now_iso: Optional[str] = None) -> List[HLDDSection]:
         """Parse HLDD document and extract structured sections"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            text = _read_markdown(file_path)
             
             sections = []
-            current_section = None
-            section_counter = 0
             
-            # Split content by headers
-            lines = content.split('\n')
-            current_content = []
+            # Every section from this parse shares one source path and one timestamp string
+            source_file = sys.intern(file_path)
+            parsed_at = now_iso or datetime.now().isoformat()
             
-            for line in lines:
-                # Check for markdown headers
-                header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-                
-                if header_match:
-                    # Save previous section if exists
-                    if current_section:
-                        current_section.content = '\n'.join(current_content).strip()
-                        sections.append(current_section)
-                    
-                    # Create new section
-                    header_level = len(header_match.group(1))
-                    header_title = header_match.group(2).strip()
-                    section_counter += 1
-                    
-                    current_section = HLDDSection(
-                        section_id=f"section_{section_counter:03d}",
-                        title=header_title,
-                        content="",
-                        level=header_level,
-                        metadata={
-                            'source_file': file_path,
-                            'line_number': len(sections) + 1,
-                            'category': self._classify_section_content(header_title)
-                        }
-                    )
-                    current_content = []
-                else:
-                    current_content.append(line)
+            # One finditer pass locates every header; a section's body is the text between
+            # its header line and the next header (or the end of the document)
+            header_matches = list(HEADER_PATTERN.finditer(text))
+            body_ends = [header_match.start() for header_match in header_matches[1:]]
+            body_ends.append(len(text))
             
-            # Add final section
-            if current_section:
-                current_section.content = '\n'.join(current_content).strip()
-                sections.append(current_section)
+            for header_match, body_end in zip(header_matches, body_ends):
+                sections.append(self._new_section(
+                    header_match, len(sections) + 1, _stripped_slice(text, header_match.end(), body_end),
+                    source_file, parsed_at
+                ))
             
             # Establish parent-child relationships
             self._establish_section_hierarchy(sections)
@@ -268,24 +427,92 @@ class HLDDSemanticMapper:
             self.logger.error(f"Error parsing HLDD document {file_path}: {e}")
             return []
     
+    def parse_and_extract(self, file_path: str,
+                          now_iso: Optional[str] = None) -> Tuple[List[HLDDSection], List[Dict[str, Any]]]:
+        """Parse an HLDD document and extract its actionable items in a single scan"""
+        try:
+            text = _read_markdown(file_path)
+            
+            sections = []
+            actionable_items = []
+            source_file = sys.intern(file_path)
+            now_iso = now_iso or datetime.now().isoformat()
+            
+            section = None
+            body_start = 0
+            line_num = 0
+            scanned_to = 0
+            
+            # Headers open sections; any other match is a task-candidate line in the open section.
+            # Line numbers count from the start of the stripped body, as in extract_actionable_items
+            for match in DOCUMENT_PATTERN.finditer(text):
+                if match.group(1):
+                    if section is not None:
+                        section.content = _stripped_slice(text, body_start, match.start())
+                    
+                    section = self._new_section(match, len(sections) + 1, '', source_file, now_iso)
+                    sections.append(section)
+                    body_start = match.end()
+                    scanned_to = LEADING_WHITESPACE.match(text, body_start).end()
+                    line_num = 0
+                elif section is not None:
+                    line_start = match.start()
+                    if line_start > scanned_to:
+                        line_num += text.count('\n', scanned_to, line_start)
+                        scanned_to = line_start
+                    
+                    line_end = text.find('\n', line_start)
+                    line = text[line_start:line_end if line_end != -1 else len(text)].strip()
+                    self._append_line_tasks(actionable_items, section, line, line_num, now_iso)
+            
+            if section is not None:
+                section.content = _stripped_slice(text, body_start, len(text))
+            
+            # Establish parent-child relationships
+            self._establish_section_hierarchy(sections)
+            
+            self.logger.info(f"Parsed {len(sections)} sections from {file_path}")
+            return sections, actionable_items
+            
+        except Exception as e:
+            self.logger.error(f"Error parsing HLDD document {file_path}: {e}")
+            return [], []
+    
+    def _new_section(self, header_match, section_number: int, content: str,
+                     source_file: str, parsed_at: str) -> HLDDSection:
+        """Build the section opened by a header match"""
+        header_title = header_match.group(2).strip()
+        
+        return HLDDSection(
+            section_id=f"section_{section_number:03d}",
+            title=header_title,
+            content=content,
+            level=len(header_match.group(1)),
+            metadata={
+                'source_file': source_file,
+                'line_number': section_number,
+                'category': self._classify_section_content(header_title)
+            },
+            last_updated=parsed_at
+        )
+    
     def _classify_section_content(self, title: str) -> str:
         """Classify section content based on title and patterns"""
-        title_lower = title.lower()
-        
-        for category, patterns in self.section_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, title_lower):
-                    return category
-        
-        return 'general'
+        return _classify_title(title)
     
     def _establish_section_hierarchy(self, sections: List[HLDDSection]):
         """Establish parent-child relationships between sections"""
+        # Open ancestors and their header levels as parallel stacks, so the pop loop
+        # compares plain ints instead of reading .level off each stacked section
         section_stack = []
+        level_stack = []
         
         for section in sections:
+            level = section.level
+            
             # Find parent section based on header level
-            while section_stack and section_stack[-1].level >= section.level:
+            while level_stack and level_stack[-1] >= level:
+                level_stack.pop()
                 section_stack.pop()
             
             if section_stack:
@@ -294,73 +521,64 @@ class HLDDSemanticMapper:
                 parent.subsections.append(section.section_id)
             
             section_stack.append(section)
+            level_stack.append(level)
     
-    def extract_actionable_items(self, sections: List[HLDDSection]) -> List[Dict[str, Any]]:
+    def extract_actionable_items(self, sections: List[HLDDSection],
+                                 now_iso: Optional[str] = None) -> List[Dict[str, Any]]:
         """Extract actionable items and tasks from HLDD sections"""
         actionable_items = []
         
-        # Patterns for identifying actionable content
-        task_patterns = [
-            r'TODO:?\s*(.+)',
-            r'Action:?\s*(.+)',
-            r'Task:?\s*(.+)',
-            r'Implementation:?\s*(.+)',
-            r'Next steps?:?\s*(.+)',
-            r'Requirements?:?\s*(.+)'
-        ]
+        # One timestamp for the whole extraction batch
+        created_at = now_iso or datetime.now().isoformat()
         
         for section in sections:
-            content_lines = section.content.split('\n')
+            content = section.content
+            line_num = 0
+            scanned_to = 0
             
-            for line_num, line in enumerate(content_lines):
-                line = line.strip()
+            # One scan over the section finds candidate lines; line numbers come from newline counts
+            for candidate in TASK_LINE_PATTERN.finditer(content):
+                line_start = candidate.start()
+                line_num += content.count('\n', scanned_to, line_start)
+                scanned_to = line_start
                 
-                for pattern in task_patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        task_description = match.group(1).strip()
-                        
-                        actionable_items.append({
-                            'id': f"{section.section_id}_task_{len(actionable_items) + 1}",
-                            'title': task_description,
-                            'section_id': section.section_id,
-                            'section_title': section.title,
-                            'category': section.metadata.get('category', 'general'),
-                            'priority': self._determine_task_priority(task_description),
-                            'status': 'pending',
-                            'created_at': datetime.now().isoformat(),
-                            'source_line': line_num + 1,
-                            'context': line
-                        })
+                line_end = content.find('\n', line_start)
+                line = content[line_start:line_end if line_end != -1 else len(content)].strip()
+                self._append_line_tasks(actionable_items, section, line, line_num, created_at)
         
         return actionable_items
     
+    def _append_line_tasks(self, actionable_items: List[Dict[str, Any]], section: HLDDSection,
+                           line: str, line_num: int, created_at: str):
+        """Append an actionable item for every task pattern found in a stripped content line"""
+        for pattern in TASK_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                task_description = match.group(1).strip()
+                
+                actionable_items.append({
+                    'id': f"{section.section_id}_task_{len(actionable_items) + 1}",
+                    'title': task_description,
+                    'section_id': section.section_id,
+                    'section_title': section.title,
+                    'category': section.metadata.get('category', 'general'),
+                    'priority': self._determine_task_priority(task_description),
+                    'status': 'pending',
+                    'created_at': created_at,
+                    'source_line': line_num + 1,
+                    'context': line
+                })
+    
     def _determine_task_priority(self, task_description: str) -> str:
         """Determine task priority based on content analysis"""
-        high_priority_keywords = [
-            'critical', 'urgent', 'immediate', 'asap', 'priority',
-            'security', 'bug', 'fix', 'error', 'issue'
-        ]
-        
-        medium_priority_keywords = [
-            'important', 'should', 'recommended', 'enhancement',
-            'improvement', 'optimization'
-        ]
-        
-        task_lower = task_description.lower()
-        
-        for keyword in high_priority_keywords:
-            if keyword in task_lower:
-                return 'high'
-        
-        for keyword in medium_priority_keywords:
-            if keyword in task_lower:
-                return 'medium'
-        
-        return 'low'
+        match = PRIORITY_PATTERN.match(task_description.lower())
+        return match.lastgroup if match else 'low'
     
-    def generate_notion_mapping(self, sections: List[HLDDSection]) -> HLDDMapping:
+    def generate_notion_mapping(self, sections: List[HLDDSection],
+                                now_iso: Optional[str] = None) -> HLDDMapping:
         """Generate Notion mapping configuration for HLDD sections"""
+        now_iso = now_iso or datetime.now().isoformat()
+        
         mapping = HLDDMapping(
             document_title="AI Trading Platform HLDD",
             version="2.0",
@@ -368,8 +586,8 @@ class HLDDSemanticMapper:
             notion_workspace_id=self.config.get('notion_workspace', {}).get('workspace_id', ''),
             notion_parent_page_id=self.config.get('notion_workspace', {}).get('parent_page_id', ''),
             sync_rules=self.config.get('sync_rules', {}),
-            created_at=datetime.now().isoformat(),
-            updated_at=datetime.now().isoformat()
+            created_at=now_iso,
+            updated_at=now_iso
         )
         
         return mapping
@@ -405,10 +623,8 @@ class HLDDSemanticMapper:
         }
         
         # Map sections to routing categories
-        for section in mapping.sections:
-            category = section.metadata.get('category', 'general')
-            
-            section_info = {
+        filemap['section_mappings'] = {
+            section.section_id: {
                 'section_id': section.section_id,
                 'title': section.title,
                 'level': section.level,
@@ -417,24 +633,24 @@ class HLDDSemanticMapper:
                 'content_length': len(section.content),
                 'last_updated': section.last_updated
             }
-            
-            filemap['section_mappings'][section.section_id] = section_info
-            
-            if category in filemap['content_routing']:
-                filemap['content_routing'][category].append(section.section_id)
-            else:
-                filemap['content_routing']['general'] = filemap['content_routing'].get('general', [])
-                filemap['content_routing']['general'].append(section.section_id)
+            for section in mapping.sections
+        }
+        
+        # One lookup per section; categories without a route collect under 'general'
+        content_routing = filemap['content_routing']
+        for section in mapping.sections:
+            routed_ids = content_routing.get(section.metadata.get('category', 'general'))
+            if routed_ids is None:
+                routed_ids = content_routing.setdefault('general', [])
+            routed_ids.append(section.section_id)
         
         return filemap
     
     def save_mapping_to_file(self, mapping: HLDDMapping, output_path: str):
         """Save HLDD mapping to JSON file"""
         try:
-            mapping_data = asdict(mapping)
-            
-            with open(output_path, 'w') as f:
-                json.dump(mapping_data, f, indent=2, default=str)
+            # Sections serialize in place (natively under orjson) rather than via a deep-copied asdict() tree
+            _write_json(mapping, output_path, default=_json_default)
             
             self.logger.info(f"HLDD mapping saved to {output_path}")
             
@@ -444,14 +660,21 @@ class HLDDSemanticMapper:
     def load_mapping_from_file(self, input_path: str) -> Optional[HLDDMapping]:
         """Load HLDD mapping from JSON file"""
         try:
-            with open(input_path, 'r') as f:
-                mapping_data = json.load(f)
+            mapping_data = _read_json(input_path)
             
-            # Reconstruct HLDDSection objects
+            # Reconstruct HLDDSection objects, interning the strings that repeat across
+            # sections so the loaded mapping holds one copy of each
             sections = []
             for section_data in mapping_data['sections']:
-                section = HLDDSection(**section_data)
-                sections.append(section)
+                metadata = section_data.get('metadata')
+                if metadata:
+                    for key in ('source_file', 'category'):
+                        if isinstance(metadata.get(key), str):
+                            metadata[key] = sys.intern(metadata[key])
+                if isinstance(section_data.get('last_updated'), str):
+                    section_data['last_updated'] = sys.intern(section_data['last_updated'])
+                
+                sections.append(HLDDSection.from_dict(section_data))
             
             mapping_data['sections'] = sections
             mapping = HLDDMapping(**mapping_data)
@@ -463,6 +686,23 @@ class HLDDSemanticMapper:
             self.logger.error(f"Error loading HLDD mapping: {e}")
             return None
 
+# Below this much HLDD text, worker start-up costs more than parsing the files in-process
+PARALLEL_PARSE_MIN_BYTES = 1024 * 1024
+
+_worker_mapper: Optional[HLDDSemanticMapper] = None
+
+def _parse_and_extract(mapper: HLDDSemanticMapper, hldd_file: str,
+                       now_iso: str) -> Tuple[List[HLDDSection], List[Dict[str, Any]]]:
+    """Parse one HLDD file and extract its actionable items"""
+    return mapper.parse_and_extract(hldd_file, now_iso)
+
+def _parse_and_extract_in_worker(hldd_file: str, now_iso: str) -> Tuple[List[HLDDSection], List[Dict[str, Any]]]:
+    """Process-pool entry point; each worker builds its mapper once"""
+    global _worker_mapper
+    if _worker_mapper is None:
+        _worker_mapper = HLDDSemanticMapper()
+    return _parse_and_extract(_worker_mapper, hldd_file, now_iso)
+
 def process_hldd_files(hldd_files: List[str], output_dir: str = "sync/mappings") -> Dict[str, Any]:
     """Process multiple HLDD files and generate comprehensive mapping"""
     mapper = HLDDSemanticMapper()
@@ -471,18 +711,26 @@ def process_hldd_files(hldd_files: List[str], output_dir: str = "sync/mappings")
     all_sections = []
     all_actionable_items = []
     
-    for hldd_file in hldd_files:
-        if os.path.exists(hldd_file):
-            sections = mapper.parse_hldd_document(hldd_file)
-            actionable_items = mapper.extract_actionable_items(sections)
-            
-            all_sections.extend(sections)
-            all_actionable_items.extend(actionable_items)
-            
-            mapper.logger.info(f"Processed {hldd_file}: {len(sections)} sections, {len(actionable_items)} tasks")
+    existing_files = [hldd_file for hldd_file in hldd_files if os.path.exists(hldd_file)]
+    
+    # One timestamp for every section, task and the mapping produced by this run
+    now_iso = datetime.now().isoformat()
+    
+    # Files parse independently; fan large sets out to worker processes, keeping file order
+    if len(existing_files) > 1 and sum(map(os.path.getsize, existing_files)) >= PARALLEL_PARSE_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=min(len(existing_files), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(_parse_and_extract_in_worker, existing_files, repeat(now_iso)))
+    else:
+        results = (_parse_and_extract(mapper, hldd_file, now_iso) for hldd_file in existing_files)
+    
+    for hldd_file, (sections, actionable_items) in zip(existing_files, results):
+        all_sections.extend(sections)
+        all_actionable_items.extend(actionable_items)
+        
+        mapper.logger.info(f"Processed {hldd_file}: {len(sections)} sections, {len(actionable_items)} tasks")
     
     # Generate comprehensive mapping
-    mapping = mapper.generate_notion_mapping(all_sections)
+    mapping = mapper.generate_notion_mapping(all_sections, now_iso)
     filemap = mapper.create_semantic_filemap(mapping)
     
     # Save outputs
@@ -492,11 +740,8 @@ def process_hldd_files(hldd_files: List[str], output_dir: str = "sync/mappings")
     
     mapper.save_mapping_to_file(mapping, mapping_file)
     
-    with open(filemap_file, 'w') as f:
-        json.dump(filemap, f, indent=2)
-    
-    with open(tasks_file, 'w') as f:
-        json.dump(all_actionable_items, f, indent=2)
+    _write_json(filemap, filemap_file)
+    _write_json(all_actionable_items, tasks_file)
     
     return {
         'mapping': mapping,
@@ -13,28 +13,81 @@ Date: July 7, 2025
 
 import os
 import sys
-import time
 import json
 import yaml
+import atexit
 import logging
+import logging.handlers
 import threading
 import signal
+import queue
+import base64
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Any, Set
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from notion_sync import NotionSyncManager, SyncConfig
 from manus_api_client import ManusApiClient, ManusApiConfig, ContentType, TaskStatus
-from sync.monitor import FileSystemMonitor, MonitorConfig, FileChangeEvent, start_monitoring, stop_monitoring
+from sync.monitor import (FileSystemMonitor, MonitorConfig, FileChangeEvent, start_monitoring, stop_monitoring,
+                          compile_excluded_patterns)
+from sync.serialization import orjson, ORJSON_AVAILABLE, load_yaml_config
+
+# Manus content type by file extension; anything else is sent as a document
+_EXT_TO_CONTENT_TYPE = {
+    '.md': ContentType.DOCUMENT,
+    '.py': ContentType.CODE,
+    '.js': ContentType.CODE,
+    '.html': ContentType.CODE,
+    '.css': ContentType.CODE,
+    '.png': ContentType.DIAGRAM,
+    '.jpg': ContentType.DIAGRAM,
+    '.svg': ContentType.DIAGRAM,
+}
+
+# Files above this size are streamed to Manus as a multipart upload instead of an inline JSON body
+MANUS_INLINE_MAX_BYTES = 1024 * 1024
+
+# Shared pool for the per-file Notion round trips and checksums of each change batch
+_SYNC_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='integrated-sync')
+
+# Background Manus uploads get their own workers so Notion syncs never queue behind them
+_UPLOAD_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='integrated-sync-upload')
+
+# Writes the 'integrated_sync' logger's queued records to its file and console handlers
+_LOG_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+def _format_json(data: Any) -> str:
+    """Render data as indented JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2)
+
+class _SyncStats:
+    """Sync counters; slot attributes keep the hot increments off dict lookups"""
+    __slots__ = ('files_synced', 'notion_updates', 'manus_tasks', 'errors', 'start_time')
+    
+    def __init__(self):
+        self.files_synced = 0
+        self.notion_updates = 0
+        self.manus_tasks = 0
+        self.errors = 0
+        self.start_time: Optional[str] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 class IntegratedSyncSystem:
     """Main integrated synchronization system"""
     
     def __init__(self, config_file: str = "sync_config.yaml"):
         self.config_file = config_file
+        # Config loading can log before _setup_logging attaches the handlers
+        self.logger = logging.getLogger('integrated_sync')
         self.config = self._load_config()
         
         # Initialize components
@@ -43,22 +96,27 @@ class IntegratedSyncSystem:
         self.file_monitor = None
         
         self.running = False
+        self._shutdown = threading.Event()
         self.logger = self._setup_logging()
         
+        # Manus uploads still in flight on the upload pool; done-callbacks discard from worker threads
+        self._pending_uploads: Set[Future] = set()
+        self._uploads_lock = threading.Lock()
+        
+        # Output directories already created for Manus downloads
+        self._created_dirs: Set[str] = set()
+        
+        # Exclusion globs compiled once into a single regex
+        self._excluded_re = compile_excluded_patterns(self.config.get('excluded_patterns', []))
+        
         # Statistics
-        self.stats = {
-            'files_synced': 0,
-            'notion_updates': 0,
-            'manus_tasks': 0,
-            'errors': 0,
-            'start_time': None
-        }
+        self.stats = _SyncStats()
+        self._stats_lock = threading.Lock()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_file, 'r') as f:
-                return yaml.safe_load(f)
+            return load_yaml_config(self.config_file, self.logger)
         except FileNotFoundError:
             self.logger.error(f"Configuration file not found: {self.config_file}")
             raise
@@ -88,8 +146,14 @@ class IntegratedSyncSystem:
         console_handler.setFormatter(formatter)
         
         if not logger.handlers:
-            logger.addHandler(file_handler)
-            logger.addHandler(console_handler)
+            # Callers only enqueue records; a listener thread does the blocking writes
+            global _LOG_LISTENER
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            _LOG_LISTENER = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+            _LOG_LISTENER.start()
+            # Drain the queue at exit, before logging.shutdown closes the handlers
+            atexit.register(_LOG_LISTENER.stop)
         
         return logger
     
@@ -119,24 +183,28 @@ class IntegratedSyncSystem:
     def _initialize_manus_client(self):
         """Initialize Manus API client"""
         try:
+            # Skip building the client config entirely when Manus is not configured
+            api_key = self.config.get('manus_api_key', '')
+            if not api_key or api_key == 'YOUR_MANUS_API_KEY_HERE':
+                self.logger.warning("Manus API key not configured, skipping Manus integration")
+                return
+            
             manus_config = ManusApiConfig(
                 api_endpoint=self.config.get('manus_api_endpoint', 'https://api.manus.space'),
-                api_key=self.config.get('manus_api_key', ''),
+                api_key=api_key,
                 timeout=self.config.get('advanced', {}).get('timeout', 30),
                 max_retries=self.config.get('advanced', {}).get('max_retries', 3),
                 retry_delay=self.config.get('advanced', {}).get('retry_delay', 5)
             )
             
-            if manus_config.api_key and manus_config.api_key != 'YOUR_MANUS_API_KEY_HERE':
-                self.manus_client = ManusApiClient(manus_config)
-                
-                # Register event handlers
-                self.manus_client.register_event_handler('task_completed', self._handle_manus_task_completed)
-                self.manus_client.register_event_handler('content_updated', self._handle_manus_content_updated)
-                
-                self.logger.info("Manus API client initialized")
-            else:
-                self.logger.warning("Manus API key not configured, skipping Manus integration")
+            manus_client = ManusApiClient(manus_config)
+            
+            # Register event handlers before publishing the client, so it is never half set up
+            manus_client.register_event_handler('task_completed', self._handle_manus_task_completed)
+            manus_client.register_event_handler('content_updated', self._handle_manus_content_updated)
+            self.manus_client = manus_client
+            
+            self.logger.info("Manus API client initialized")
                 
         except Exception as e:
             self.logger.error(f"Failed to initialize Manus client: {e}")
@@ -167,25 +235,50 @@ class IntegratedSyncSystem:
         try:
             self.logger.info(f"Processing {len(events)} file change events")
             
+            # Only the latest event per path matters; earlier ones in the batch are superseded.
+            # The monitor does not filter deletions, so excluded paths are dropped here
+            excluded_re = self._excluded_re
+            latest_events = {}
             for event in events:
-                self.stats['files_synced'] += 1
-                
-                # Sync to Notion
-                if self.notion_sync and event.event_type in ['created', 'modified']:
-                    if os.path.exists(event.file_path):
-                        success = self.notion_sync.sync_file_to_notion(event.file_path)
-                        if success:
-                            self.stats['notion_updates'] += 1
-                        else:
-                            self.stats['errors'] += 1
-                
-                # Sync to Manus if configured
-                if self.manus_client and event.event_type in ['created', 'modified']:
-                    self._sync_file_to_manus(event.file_path)
-                
-                # Handle deletions
+                if excluded_re is None or not excluded_re.search(event.file_path):
+                    latest_events[event.file_path] = event
+            self._add_stats(files_synced=len(latest_events))
+            
+            # One stat per path, reused by the Manus upload
+            file_stats = {}
+            deleted_paths = []
+            for file_path, event in latest_events.items():
                 if event.event_type == 'deleted':
-                    self._handle_file_deletion(event.file_path)
+                    deleted_paths.append(file_path)
+                elif event.event_type in ('created', 'modified'):
+                    try:
+                        file_stats[file_path] = os.stat(file_path)
+                    except FileNotFoundError:
+                        continue
+            candidate_paths = list(file_stats)
+            
+            if deleted_paths:
+                self._handle_file_deletions(deleted_paths)
+            
+            # Overlap the per-file Notion and Manus round trips instead of paying for them serially;
+            # Manus uploads finish in the background on their own pool since only Notion results
+            # gate the state save. Manus keeps no checksums here, so every changed file is sent
+            if self.manus_client:
+                batch_now = datetime.now().isoformat()
+                for path in candidate_paths:
+                    future = _UPLOAD_POOL.submit(self._sync_file_to_manus, path, file_stats[path], batch_now)
+                    with self._uploads_lock:
+                        self._pending_uploads.add(future)
+                    future.add_done_callback(self._forget_upload)
+            
+            if self.notion_sync:
+                # Skip Notion pages whose file still matches the checksum of its last Notion sync;
+                # hashlib releases the GIL on large buffers, so the batch's checksums hash in parallel
+                unchanged = _SYNC_POOL.map(self._is_unchanged_since_sync, candidate_paths)
+                changed_paths = [path for path, is_unchanged in zip(candidate_paths, unchanged) if not is_unchanged]
+                results = list(_SYNC_POOL.map(self.notion_sync.sync_file_to_notion, changed_paths))
+                successes = sum(1 for success in results if success)
+                self._add_stats(notion_updates=successes, errors=len(results) - successes)
             
             # Save state after processing
             if self.notion_sync:
@@ -193,28 +286,62 @@ class IntegratedSyncSystem:
                 
         except Exception as e:
             self.logger.error(f"Error handling file changes: {e}")
-            self.stats['errors'] += 1
+            self._add_stats(errors=1)
     
-    def _sync_file_to_manus(self, file_path: str):
+    def _add_stats(self, files_synced: int = 0, notion_updates: int = 0, manus_tasks: int = 0, errors: int = 0):
+        """Add to several counters under one lock acquisition"""
+        stats = self.stats
+        with self._stats_lock:
+            stats.files_synced += files_synced
+            stats.notion_updates += notion_updates
+            stats.manus_tasks += manus_tasks
+            stats.errors += errors
+    
+    def _is_unchanged_since_sync(self, file_path: str) -> bool:
+        """Check whether a file still matches the checksum recorded by its last Notion sync"""
+        if not self.notion_sync:
+            return False
+        
+        stored_checksum = self.notion_sync.state.file_checksums.get(file_path)
+        return bool(stored_checksum) and self.notion_sync.calculate_file_checksum(file_path) == stored_checksum
+    
+    def _sync_file_to_manus(self, file_path: str, file_stat: Optional[os.stat_result] = None,
+                            now_iso: Optional[str] = None):
         """Sync a file to Manus platform"""
         try:
-            if not os.path.exists(file_path):
-                return
+            if now_iso is None:
+                now_iso = datetime.now().isoformat()
+            
+            if file_stat is None:
+                try:
+                    file_stat = os.stat(file_path)
+                except FileNotFoundError:
+                    return
             
             # Determine content type based on file extension
             file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext == '.md':
-                content_type = ContentType.DOCUMENT
-            elif file_ext in ['.py', '.js', '.html', '.css']:
-                content_type = ContentType.CODE
-            elif file_ext in ['.png', '.jpg', '.svg']:
-                content_type = ContentType.DIAGRAM
-            else:
-                content_type = ContentType.DOCUMENT
+            content_type = _EXT_TO_CONTENT_TYPE.get(file_ext, ContentType.DOCUMENT)
+            
+            metadata = {
+                'source_file': file_path,
+                'sync_timestamp': now_iso,
+                'file_size': file_stat.st_size
+            }
+            
+            # Stream large files straight from disk rather than building the whole body in memory
+            if file_stat.st_size > MANUS_INLINE_MAX_BYTES:
+                metadata['content_type'] = content_type.value
+                file_id = self.manus_client.submit_content_stream(file_path, metadata)
+                self.logger.info(f"Uploaded {file_path} to Manus: {file_id}")
+                return
             
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content_data = f.read()
+            # Read file content; binary diagrams are sent base64-encoded
+            file_bytes = Path(file_path).read_bytes()
+            if content_type == ContentType.DIAGRAM:
+                content_data = base64.b64encode(file_bytes).decode('ascii')
+                metadata['encoding'] = 'base64'
+            else:
+                content_data = file_bytes.decode('utf-8')
             
             # Create content object
             from manus_api_client import ManusContent
@@ -223,13 +350,9 @@ class IntegratedSyncSystem:
                 title=os.path.basename(file_path),
                 content_type=content_type,
                 content_data=content_data,
-                metadata={
-                    'source_file': file_path,
-                    'sync_timestamp': datetime.now().isoformat(),
-                    'file_size': os.path.getsize(file_path)
-                },
-                created_at=datetime.now().isoformat(),
-                updated_at=datetime.now().isoformat(),
+                metadata=metadata,
+                created_at=now_iso,
+                updated_at=now_iso,
                 version=1
             )
             
@@ -241,30 +364,38 @@ class IntegratedSyncSystem:
         except Exception as e:
             self.logger.error(f"Error syncing {file_path} to Manus: {e}")
     
-    def _handle_file_deletion(self, file_path: str):
-        """Handle file deletion events"""
+    def _forget_upload(self, future: Future):
+        """Drop a finished Manus upload from the in-flight set"""
+        with self._uploads_lock:
+            self._pending_uploads.discard(future)
+    
+    def _handle_file_deletions(self, file_paths: List[str]):
+        """Handle a batch of file deletion events"""
         try:
-            # Remove from Notion sync state
+            # Remove from Notion sync state in one locked pass for the whole batch
             if self.notion_sync:
-                if file_path in self.notion_sync.state.file_checksums:
-                    del self.notion_sync.state.file_checksums[file_path]
+                self.notion_sync.forget_files(file_paths)
                 
                 # Optionally delete from Notion (based on configuration)
                 if self.config.get('delete_from_notion_on_local_delete', False):
-                    page_id = self.notion_sync.state.notion_page_mappings.get(file_path)
-                    if page_id:
-                        try:
+                    for file_path in file_paths:
+                        if self.notion_sync.state.notion_page_mappings.get(file_path):
                             # Note: Notion API doesn't support page deletion
                             # We could archive or move to trash instead
                             self.logger.info(f"File {file_path} deleted locally, Notion page preserved")
-                        except Exception as e:
-                            self.logger.error(f"Error handling Notion page for deleted file: {e}")
             
-            self.logger.info(f"Handled deletion of {file_path}")
+            for file_path in file_paths:
+                self.logger.info(f"Handled deletion of {file_path}")
             
         except Exception as e:
             self.logger.error(f"Error handling file deletion: {e}")
     
+    def _ensure_dir(self, directory: str):
+        """Create an output directory once; later calls skip the makedirs stat walk"""
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+    
     def _handle_manus_task_completed(self, data: Dict[str, Any]):
         """Handle Manus task completion events"""
         try:
@@ -272,19 +403,23 @@ class IntegratedSyncSystem:
             result_files = data.get('result_files', [])
             
             self.logger.info(f"Manus task completed: {task_id}")
-            self.stats['manus_tasks'] += 1
+            self._add_stats(manus_tasks=1)
             
-            # Download result files if any
-            for file_id in result_files:
-                output_path = f"manus_results/{task_id}_{file_id}"
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                
-                if self.manus_client.download_file(file_id, output_path):
+            # Download result files if any, overlapping their round trips on the sync pool
+            output_paths = [f"manus_results/{task_id}_{file_id}" for file_id in result_files]
+            for output_path in output_paths:
+                self._ensure_dir(os.path.dirname(output_path))
+            
+            downloaded_paths = []
+            for output_path, success in zip(output_paths, _SYNC_POOL.map(self.manus_client.download_file,
+                                                                         result_files, output_paths)):
+                if success:
                     self.logger.info(f"Downloaded Manus result: {output_path}")
-                    
-                    # Trigger sync of the downloaded file
-                    if self.notion_sync:
-                        self.notion_sync.sync_file_to_notion(output_path)
+                    downloaded_paths.append(output_path)
+            
+            # Trigger sync of the downloaded files
+            if self.notion_sync and downloaded_paths:
+                list(_SYNC_POOL.map(self.notion_sync.sync_file_to_notion, downloaded_paths))
             
         except Exception as e:
             self.logger.error(f"Error handling Manus task completion: {e}")
@@ -301,7 +436,7 @@ class IntegratedSyncSystem:
                 if content:
                     # Save to local file
                     local_path = f"manus_content/{content.title}"
-                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                    self._ensure_dir(os.path.dirname(local_path))
                     
                     with open(local_path, 'w', encoding='utf-8') as f:
                         f.write(content.content_data)
@@ -315,8 +450,9 @@ class IntegratedSyncSystem:
         """Start the integrated synchronization system"""
         try:
             self.logger.info("Starting Integrated Manus-Notion Sync System")
-            self.stats['start_time'] = datetime.now().isoformat()
+            self.stats.start_time = datetime.now().isoformat()
             self.running = True
+            self._shutdown.clear()
             
             # Initialize components
             self._initialize_notion_sync()
@@ -346,6 +482,7 @@ class IntegratedSyncSystem:
         try:
             self.logger.info("Stopping Integrated Manus-Notion Sync System")
             self.running = False
+            self._shutdown.set()
             
             # Stop file monitor
             if self.file_monitor:
@@ -355,8 +492,11 @@ class IntegratedSyncSystem:
             if self.notion_sync:
                 self.notion_sync.stop()
             
-            # Stop Manus client
+            # Stop Manus client once its in-flight uploads have finished
             if self.manus_client:
+                with self._uploads_lock:
+                    pending_uploads = list(self._pending_uploads)
+                wait(pending_uploads, timeout=30)
                 self.manus_client.stop()
             
             self.logger.info("Integrated sync system stopped")
@@ -372,7 +512,7 @@ class IntegratedSyncSystem:
             if self.notion_sync:
                 results = self.notion_sync.perform_full_sync()
                 total_synced = sum(results.values())
-                self.stats['notion_updates'] += total_synced
+                self._add_stats(notion_updates=total_synced)
                 self.logger.info(f"Initial sync completed: {total_synced} files synced to Notion")
             
         except Exception as e:
@@ -380,10 +520,14 @@ class IntegratedSyncSystem:
     
     def get_status(self) -> Dict[str, Any]:
         """Get current system status"""
+        # Snapshot the counters together; the monitor and Manus threads update them concurrently
+        with self._stats_lock:
+            statistics = self.stats.as_dict()
+        
         status = {
             'running': self.running,
-            'start_time': self.stats['start_time'],
-            'statistics': self.stats.copy()
+            'start_time': statistics['start_time'],
+            'statistics': statistics
         }
         
         if self.notion_sync:
@@ -422,7 +566,7 @@ def main():
         if args.status:
             status = sync_system.get_status()
             print("Integrated Sync System Status:")
-            print(json.dumps(status, indent=2))
+            print(_format_json(status))
             return
         
         if args.initial_sync:
@@ -438,10 +582,11 @@ def main():
         # Start the system
         sync_system.start()
         
-        # Keep running
+        # Keep running until stop() or a shutdown signal sets the event; the bounded wait
+        # lets Ctrl+C through on Windows, where an untimed Event.wait() cannot be interrupted
         try:
-            while sync_system.running:
-                time.sleep(1)
+            while not sync_system._shutdown.wait(1.0):
+                pass
         except KeyboardInterrupt:
             pass
         
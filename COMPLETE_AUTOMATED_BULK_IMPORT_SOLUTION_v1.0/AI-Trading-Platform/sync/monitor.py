@@ -13,20 +13,101 @@ Date: July 7, 2025
 """
 
 import os
+import re
 import sys
 import time
 import json
 import logging
 import hashlib
 import threading
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Callable
+from typing import Dict, List, Set, Optional, Callable, Pattern, Tuple
 from dataclasses import dataclass, asdict
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler, FileSystemEvent
 import queue
 
+# BLAKE3 (SIMD, multi-lane) and xxHash3 checksum far faster than hashlib; BLAKE2b is the fallback
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Change detection only needs a fast, well-distributed hash, not a cryptographic one
+if BLAKE3_AVAILABLE:
+    _new_checksum_hasher = blake3.blake3
+elif XXHASH_AVAILABLE:
+    _new_checksum_hasher = xxhash.xxh3_64
+else:
+    _new_checksum_hasher = functools.partial(hashlib.blake2b, digest_size=16)
+
+# Largest read made while checksumming a file
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Stat-keyed checksums are only cached for files last modified longer ago than this, since a
+# same-size write within the filesystem's timestamp granularity would leave the stat unchanged
+RACY_MTIME_WINDOW_NS = 1_000_000_000
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a glob into a regex whose wildcards stay within one path component"""
+    parts = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        i += 1
+        if char == '*':
+            parts.append('[^/\\\\]*')
+        elif char == '?':
+            parts.append('[^/\\\\]')
+        elif char in '/\\':
+            # Either separator in the pattern matches either separator in the path
+            parts.append('[/\\\\]')
+        elif char == '[':
+            # Character class as in fnmatch: leading '!' negates, a leading ']' is literal
+            end = i
+            if end < n and pattern[end] == '!':
+                end += 1
+            if end < n and pattern[end] == ']':
+                end += 1
+            end = pattern.find(']', end)
+            if end == -1:
+                parts.append('\\[')
+                continue
+            members = re.sub(r'([\\^\[&~|])', r'\\\1', pattern[i:end])
+            i = end + 1
+            if members.startswith('!'):
+                # A negated class never matches a separator either
+                parts.append(f"[^{members[1:]}/\\\\]")
+            else:
+                parts.append(f"[{members}]")
+        else:
+            parts.append(re.escape(char))
+    return ''.join(parts)
+
+def compile_excluded_patterns(patterns: List[str]) -> Optional[Pattern]:
+    """Compile exclusion globs into one regex that also matches everything below a matched directory"""
+    # As in .gitignore, 'dir/' matches only a directory; a pattern without the trailing slash
+    # matches a file or a directory of that name, so 'node_modules' excludes a/node_modules/x.js
+    alternatives = []
+    for pattern in patterns:
+        if pattern.endswith('/'):
+            alternatives.append(f"(?:^|[/\\\\]){_glob_to_regex(pattern.rstrip('/'))}[/\\\\]")
+        elif pattern:
+            alternatives.append(f"(?:^|[/\\\\]){_glob_to_regex(pattern)}(?:[/\\\\]|$)")
+    
+    if not alternatives:
+        return None
+    return re.compile('|'.join(alternatives))
+
 @dataclass
 class FileChangeEvent:
     """Represents a file system change event"""
@@ -57,7 +138,11 @@ class FileSystemMonitor:
         self.observer = Observer()
         self.event_queue = queue.Queue()
         self.file_checksums: Dict[str, str] = {}
+        # Last computed checksum per path, keyed by the (st_mtime_ns, st_size) it was computed at
+        self._stat_checksums: Dict[str, Tuple[Tuple[int, int], str]] = {}
         self.pending_events: Dict[str, FileChangeEvent] = {}
+        # All exclusion globs compiled into one regex instead of a per-event pattern loop
+        self._exclude_re = compile_excluded_patterns(config.excluded_patterns)
         self.last_event_time: Dict[str, float] = {}
         self.running = False
         
@@ -85,14 +170,34 @@ class FileSystemMonitor:
             return None
         
         try:
-            hash_md5 = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+            hasher = _new_checksum_hasher()
+            with open(file_path, "rb", buffering=0) as f:
+                # Read into one buffer sized to the file (up to 1 MiB) instead of a bytes object
+                # per 4 KiB chunk; watched files are not mmapped since truncation would SIGBUS
+                buffer = bytearray(min(max(os.fstat(f.fileno()).st_size, 1), CHECKSUM_CHUNK_SIZE))
+                view = memoryview(buffer)
+                while True:
+                    read_size = f.readinto(buffer)
+                    if not read_size:
+                        break
+                    hasher.update(view[:read_size])
+            return hasher.hexdigest()
         except (OSError, IOError):
             return None
     
+    def _checksum_for_stat(self, file_path: str, file_stat: os.stat_result) -> Optional[str]:
+        """Return the file's checksum, rehashing only when its (mtime_ns, size) has changed"""
+        stat_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._stat_checksums.get(file_path)
+        if cached is not None and cached[0] == stat_key:
+            return cached[1]
+        
+        hash_started_ns = time.time_ns()
+        checksum = self._calculate_checksum(file_path)
+        if checksum and hash_started_ns - file_stat.st_mtime_ns > RACY_MTIME_WINDOW_NS:
+            self._stat_checksums[file_path] = (stat_key, checksum)
+        return checksum
+    
     def _get_file_size(self, file_path: str) -> Optional[int]:
         """Get file size in bytes"""
         try:
@@ -102,25 +207,25 @@ class FileSystemMonitor:
     
     def _should_monitor_file(self, file_path: str) -> bool:
         """Determine if a file should be monitored"""
+        # Check excluded patterns before touching the filesystem
+        if self._exclude_re and self._exclude_re.search(file_path):
+            return False
+        
         # Check file size
         file_size = self._get_file_size(file_path)
         if file_size and file_size > (self.config.max_file_size_mb * 1024 * 1024):
             return False
         
-        # Check excluded patterns
-        file_name = os.path.basename(file_path)
-        for pattern in self.config.excluded_patterns:
-            if pattern.replace('*', '') in file_name or pattern in file_path:
-                return False
-        
         return True
     
     def _is_file_changed(self, file_path: str) -> bool:
         """Check if file has actually changed using checksum"""
-        if not os.path.exists(file_path):
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
             return True  # File was deleted
         
-        current_checksum = self._calculate_checksum(file_path)
+        current_checksum = self._checksum_for_stat(file_path, file_stat)
         stored_checksum = self.file_checksums.get(file_path)
         
         if current_checksum != stored_checksum:
@@ -135,9 +240,15 @@ class FileSystemMonitor:
         checksum = None
         file_size = None
         
-        if os.path.exists(file_path) and event_type != 'deleted':
-            checksum = self._calculate_checksum(file_path)
-            file_size = self._get_file_size(file_path)
+        if event_type != 'deleted':
+            # One stat serves both the size and the checksum cache lookup
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                file_stat = None
+            if file_stat is not None:
+                checksum = self._checksum_for_stat(file_path, file_stat)
+                file_size = file_stat.st_size
         
         return FileChangeEvent(
             file_path=file_path,
@@ -231,8 +342,14 @@ class SyncEventHandler(FileSystemEventHandler):
     
     def __init__(self, monitor: FileSystemMonitor):
         self.monitor = monitor
+        # Deletes and moves never reach _should_monitor_file, so they check exclusions here
+        self._exclude_re = monitor._exclude_re
         super().__init__()
     
+    def _is_excluded(self, file_path: str) -> bool:
+        """Check a path against the monitor's compiled exclusion patterns"""
+        return bool(self._exclude_re and self._exclude_re.search(file_path))
+    
     def on_created(self, event: FileSystemEvent):
         if not event.is_directory and self.monitor._should_monitor_file(event.src_path):
             self.monitor.logger.debug(f"File created: {event.src_path}")
@@ -244,22 +361,25 @@ class SyncEventHandler(FileSystemEventHandler):
             self.monitor._debounce_event(event.src_path, 'modified')
     
     def on_deleted(self, event: FileSystemEvent):
-        if not event.is_directory:
+        if not event.is_directory and not self._is_excluded(event.src_path):
             self.monitor.logger.debug(f"File deleted: {event.src_path}")
             self.monitor._debounce_event(event.src_path, 'deleted')
             # Remove from checksum cache
             self.monitor.file_checksums.pop(event.src_path, None)
+            self.monitor._stat_checksums.pop(event.src_path, None)
     
     def on_moved(self, event: FileSystemEvent):
         if not event.is_directory:
             self.monitor.logger.debug(f"File moved: {event.src_path} -> {event.dest_path}")
-            # Handle as delete + create
-            self.monitor._debounce_event(event.src_path, 'deleted')
+            # Handle as delete + create; an excluded temp file renamed into place still counts as created
+            if not self._is_excluded(event.src_path):
+                self.monitor._debounce_event(event.src_path, 'deleted')
             if self.monitor._should_monitor_file(event.dest_path):
                 self.monitor._debounce_event(event.dest_path, 'created', event.src_path)
             
             # Update checksum cache
             old_checksum = self.monitor.file_checksums.pop(event.src_path, None)
+            self.monitor._stat_checksums.pop(event.src_path, None)
             if old_checksum and self.monitor._should_monitor_file(event.dest_path):
                 self.monitor.file_checksums[event.dest_path] = old_checksum
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Shared Serialization Helpers for the Sync Framework
+===================================================
+
+YAML loader/dumper selection, the optional orjson import and the JSON sidecar
+cache for parsed YAML configs, shared by the sync, backlog and HLDD modules.
+
+Author: Manus AI
+Version: 1.0
+Date: July 7, 2025
+"""
+
+import os
+import re
+import json
+import yaml
+import logging
+from typing import Any, List, Optional
+
+# libyaml's C loader/dumper are much faster; fall back to pure Python when absent
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
+# orjson serializes dataclasses and enums natively and writes JSON far faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Config keys whose values are credentials; configs holding any are never cached to disk
+CREDENTIAL_KEY_PATTERN = re.compile(r'token|secret|password|passwd|api_?key|credential', re.IGNORECASE)
+
+
+def load_yaml_config(config_path: str, logger: logging.Logger) -> Any:
+    """Load a YAML config, reusing its JSON sidecar while the YAML file is unchanged"""
+    stat = os.stat(config_path)
+    cache_key = [stat.st_mtime_ns, stat.st_size]
+    cached_config = _read_config_cache(config_path, cache_key)
+    if cached_config is not None and not _contains_credentials(cached_config):
+        return cached_config
+
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=YamlLoader)
+
+    if _contains_credentials(config):
+        # Secrets stay in the YAML file only; drop any sidecar an earlier version left behind
+        _remove_config_cache(config_path, logger)
+    else:
+        _write_config_cache(config_path, cache_key, config, logger)
+    return config
+
+
+def _contains_credentials(value: Any) -> bool:
+    """Whether a parsed config holds a non-empty value under a credential-like key"""
+    if isinstance(value, dict):
+        return any(
+            (isinstance(key, str) and CREDENTIAL_KEY_PATTERN.search(key) and item)
+            or _contains_credentials(item)
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return any(_contains_credentials(item) for item in value)
+    return False
+
+
+def _read_config_cache(config_path: str, cache_key: List[int]) -> Optional[Any]:
+    """Return the cached parsed config if it was built from the current YAML file"""
+    try:
+        with open(f"{config_path}.cache.json", 'r') as f:
+            cache = json.load(f)
+        if cache.get('key') == cache_key:
+            return cache['data']
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return None
+
+
+def _write_config_cache(config_path: str, cache_key: List[int], config: Any, logger: logging.Logger):
+    """Atomically write the parsed config to a JSON sidecar keyed by mtime and size"""
+    cache_path = f"{config_path}.cache.json"
+    try:
+        payload = json.dumps({'key': cache_key, 'data': config})
+        # Only cache configs that survive a JSON round trip unchanged
+        if json.loads(payload)['data'] != config:
+            return
+
+        # Readable by the owner only, whatever the umask or a leftover temp file's mode
+        tmp_path = f"{cache_path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(payload)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not cache config {config_path}: {e}")
+
+
+def _remove_config_cache(config_path: str, logger: logging.Logger):
+    """Delete a config's JSON sidecar if one exists"""
+    try:
+        os.remove(f"{config_path}.cache.json")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove config cache for {config_path}: {e}")
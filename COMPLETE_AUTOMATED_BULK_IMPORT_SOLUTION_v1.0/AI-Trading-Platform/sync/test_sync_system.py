@@ -15,20 +15,29 @@ import os
 import sys
 import time
 import json
+import hashlib
 import tempfile
 import shutil
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
+from concurrent.futures import wait
 import threading
 
-# Add parent directory to path for imports
+# Add parent directory (and its scripts directory) to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
 
 # Import components to test
 from notion_sync import NotionSyncManager, SyncConfig, SyncState
 from manus_api_client import ManusApiClient, ManusApiConfig, ContentType, TaskStatus
-from sync.monitor import FileSystemMonitor, MonitorConfig, FileChangeEvent
+from sync.monitor import (FileSystemMonitor, MonitorConfig, FileChangeEvent, SyncEventHandler,
+                          RACY_MTIME_WINDOW_NS)
+from sync.hldd_integration_mapper import HLDDSemanticMapper
+from sync.integrated_sync import IntegratedSyncSystem
+from sync.backlog_task_router import (TaskItem, TaskCategory, TaskPriority, TaskStatus as BacklogTaskStatus,
+                                      _coerce_enum)
+from bulk_file_analyzer import BulkFileAnalyzer, PARTIAL_HASH_SIZE
 
 class TestSyncConfig(unittest.TestCase):
     """Test SyncConfig functionality"""
@@ -159,6 +168,64 @@ class TestFileSystemMonitor(unittest.TestCase):
         
         # Should detect change again
         self.assertTrue(self.monitor._is_file_changed(test_file))
+    
+    def test_stat_checksum_not_cached_within_racy_window(self):
+        """Test that a same-size rewrite within the mtime granularity is still detected"""
+        test_file = os.path.join(self.test_dir, "test.txt")
+        
+        with open(test_file, 'w') as f:
+            f.write("aaaa")
+        file_stat = os.stat(test_file)
+        checksum1 = self.monitor._checksum_for_stat(test_file, file_stat)
+        self.assertNotIn(test_file, self.monitor._stat_checksums)
+        
+        # Same size and same mtime, as on a filesystem with coarse timestamps
+        with open(test_file, 'w') as f:
+            f.write("bbbb")
+        os.utime(test_file, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+        checksum2 = self.monitor._checksum_for_stat(test_file, os.stat(test_file))
+        
+        self.assertNotEqual(checksum1, checksum2)
+    
+    def test_stat_checksum_cached_outside_racy_window(self):
+        """Test that a file last modified before the racy window is hashed once"""
+        test_file = os.path.join(self.test_dir, "test.txt")
+        
+        with open(test_file, 'w') as f:
+            f.write("test content")
+        old_mtime_ns = time.time_ns() - 10 * RACY_MTIME_WINDOW_NS
+        os.utime(test_file, ns=(old_mtime_ns, old_mtime_ns))
+        file_stat = os.stat(test_file)
+        
+        checksum = self.monitor._checksum_for_stat(test_file, file_stat)
+        self.assertEqual(self.monitor._stat_checksums[test_file][1], checksum)
+        
+        with patch.object(self.monitor, '_calculate_checksum') as mock_calculate:
+            self.assertEqual(self.monitor._checksum_for_stat(test_file, file_stat), checksum)
+            mock_calculate.assert_not_called()
+    
+    def test_stat_checksum_invalidated_on_delete_and_move(self):
+        """Test that deleting or moving a file drops its cached checksum"""
+        handler = SyncEventHandler(self.monitor)
+        old_mtime_ns = time.time_ns() - 10 * RACY_MTIME_WINDOW_NS
+        
+        deleted_file = os.path.join(self.test_dir, "deleted.txt")
+        moved_file = os.path.join(self.test_dir, "moved.txt")
+        for test_file in (deleted_file, moved_file):
+            with open(test_file, 'w') as f:
+                f.write("test content")
+            os.utime(test_file, ns=(old_mtime_ns, old_mtime_ns))
+            self.monitor._checksum_for_stat(test_file, os.stat(test_file))
+            self.assertIn(test_file, self.monitor._stat_checksums)
+        
+        os.remove(deleted_file)
+        handler.on_deleted(Mock(is_directory=False, src_path=deleted_file))
+        self.assertNotIn(deleted_file, self.monitor._stat_checksums)
+        
+        dest_file = os.path.join(self.test_dir, "renamed.txt")
+        os.rename(moved_file, dest_file)
+        handler.on_moved(Mock(is_directory=False, src_path=moved_file, dest_path=dest_file))
+        self.assertNotIn(moved_file, self.monitor._stat_checksums)
 
 class TestNotionSyncManager(unittest.TestCase):
     """Test NotionSyncManager functionality"""
@@ -248,6 +315,136 @@ Another paragraph."""
         self.assertTrue(manager.should_sync_file(sync_file))
         self.assertFalse(manager.should_sync_file(tmp_file))
 
+class TestHLDDSemanticMapper(unittest.TestCase):
+    """Test HLDDSemanticMapper functionality"""
+    
+    def setUp(self):
+        """Setup test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.hldd_file = os.path.join(self.test_dir, "HLDD_TEST.md")
+        
+        with open(self.hldd_file, 'w') as f:
+            f.write("""Preamble with a TODO: outside any section
+
+# System Architecture
+
+Overview of the system.
+TODO: Document the data flow
+
+## Implementation Plan
+  
+Action: Set up the repository (urgent)
+Some notes between tasks.
+
+- Task: Write the ingestion service
+Next steps: review with the team
+### Empty Section
+#### Requirements
+Requirement: Support Windows paths
+""")
+        
+        self.mapper = HLDDSemanticMapper(os.path.join(self.test_dir, "hldd_config.yaml"))
+    
+    def tearDown(self):
+        """Cleanup test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+    
+    def test_parse_and_extract_matches_separate_passes(self):
+        """Test that the fused scan matches parse_hldd_document plus extract_actionable_items"""
+        now_iso = "2025-07-07T00:00:00"
+        
+        sections = self.mapper.parse_hldd_document(self.hldd_file, now_iso)
+        actionable_items = self.mapper.extract_actionable_items(sections, now_iso)
+        fused_sections, fused_items = self.mapper.parse_and_extract(self.hldd_file, now_iso)
+        
+        self.assertEqual(len(sections), 4)
+        self.assertGreater(len(actionable_items), 0)
+        self.assertEqual([vars(section) for section in fused_sections], [vars(section) for section in sections])
+        self.assertEqual(fused_items, actionable_items)
+
+class TestBulkFileAnalyzer(unittest.TestCase):
+    """Test BulkFileAnalyzer functionality"""
+    
+    def setUp(self):
+        """Setup test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.test_dir, "source")
+        os.makedirs(os.path.join(self.source_dir, "nested"))
+        
+        large_block = b"x" * (PARTIAL_HASH_SIZE * 2)
+        test_files = {
+            # Small duplicates, fully covered by the partial hash
+            "small_a.txt": b"same small content",
+            "nested/small_b.txt": b"same small content",
+            # Same size as the small duplicates but different content
+            "small_c.txt": b"other small conten",
+            # Large duplicates
+            "large_a.md": large_block + b"tail",
+            "nested/large_b.md": large_block + b"tail",
+            # Same size and first block as the large duplicates, different tail
+            "large_c.md": large_block + b"TAIL",
+            # Same size as the large duplicates, different first block
+            "large_d.md": b"y" * (PARTIAL_HASH_SIZE * 2) + b"tail",
+            "unique.txt": b"a file with a size of its own"
+        }
+        for name, content in test_files.items():
+            with open(os.path.join(self.source_dir, name), 'wb') as f:
+                f.write(content)
+        
+        self.analyzer = BulkFileAnalyzer(self.source_dir, os.path.join(self.test_dir, "results"))
+    
+    def tearDown(self):
+        """Cleanup test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+    
+    def test_staged_duplicate_detection_matches_full_hash_groups(self):
+        """Test that size/partial-hash/full-hash staging finds the same groups as hashing every file"""
+        self.analyzer.analyze_collection()
+        
+        full_hash_groups = {}
+        for analysis in self.analyzer.file_analyses:
+            content_hash = self.analyzer._calculate_file_hash(Path(analysis.file_path))
+            full_hash_groups.setdefault(content_hash, []).append(analysis.file_path)
+        expected_groups = {frozenset(group) for group in full_hash_groups.values() if len(group) > 1}
+        
+        duplicates = self.analyzer._compute_duplicates()
+        
+        self.assertEqual(len(expected_groups), 2)
+        self.assertEqual({frozenset(group) for group in duplicates.groups}, expected_groups)
+        self.assertEqual(duplicates.total_redundant, 2)
+
+class TestBacklogTaskItem(unittest.TestCase):
+    """Test backlog TaskItem serialization"""
+    
+    def test_coerce_enum_accepts_values_and_legacy_names(self):
+        """Test enum coercion from values, enum members and legacy 'EnumName.MEMBER' strings"""
+        self.assertEqual(_coerce_enum(TaskCategory, "security"), TaskCategory.SECURITY)
+        self.assertEqual(_coerce_enum(TaskCategory, TaskCategory.SECURITY), TaskCategory.SECURITY)
+        self.assertEqual(_coerce_enum(TaskCategory, "TaskCategory.BUG_FIX"), TaskCategory.BUG_FIX)
+        self.assertEqual(_coerce_enum(TaskPriority, "TaskPriority.HIGH"), TaskPriority.HIGH)
+        
+        with self.assertRaises(ValueError):
+            _coerce_enum(TaskCategory, "not_a_category")
+        with self.assertRaises(KeyError):
+            _coerce_enum(TaskCategory, "TaskCategory.NOT_A_MEMBER")
+    
+    def test_task_item_from_legacy_record(self):
+        """Test loading a task record written with str(enum) values"""
+        task = TaskItem.from_dict({
+            'id': 'task_0001',
+            'title': 'Legacy task',
+            'description': 'Saved by an older version of the router',
+            'category': 'TaskCategory.PROJECT_MANAGEMENT',
+            'priority': 'TaskPriority.CRITICAL',
+            'status': 'TaskStatus.IN_PROGRESS'
+        })
+        
+        self.assertEqual(task.category, TaskCategory.PROJECT_MANAGEMENT)
+        self.assertEqual(task.priority, TaskPriority.CRITICAL)
+        self.assertEqual(task.status, BacklogTaskStatus.IN_PROGRESS)
+
 class TestManusApiClient(unittest.TestCase):
     """Test ManusApiClient functionality"""
     
@@ -340,6 +537,70 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("Test Document", content)
         self.assertIn("sync testing", content)
 
+class TestIntegratedSyncSystem(unittest.TestCase):
+    """Test IntegratedSyncSystem functionality"""
+    
+    def setUp(self):
+        """Setup test environment"""
+        self.test_dir = tempfile.mkdtemp()
+        self.config_file = os.path.join(self.test_dir, "test_config.yaml")
+        
+        test_config = {
+            'notion_token': 'test_token',
+            'sync_directories': [self.test_dir],
+            'excluded_patterns': ['*.tmp'],
+            'advanced': {'log_file': os.path.join(self.test_dir, "integrated_sync.log")}
+        }
+        
+        import yaml
+        with open(self.config_file, 'w') as f:
+            yaml.dump(test_config, f)
+        
+        self.system = IntegratedSyncSystem(self.config_file)
+    
+    def tearDown(self):
+        """Cleanup test environment"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+    
+    def test_unchanged_files_skip_notion_only(self):
+        """Test that files matching their last Notion checksum skip Notion but still reach Manus"""
+        unchanged_file = os.path.join(self.test_dir, "unchanged.md")
+        changed_file = os.path.join(self.test_dir, "changed.md")
+        
+        with open(unchanged_file, 'w') as f:
+            f.write("# Already synced")
+        with open(changed_file, 'w') as f:
+            f.write("# Edited since the last sync")
+        
+        def md5_checksum(file_path):
+            with open(file_path, 'rb') as f:
+                return hashlib.md5(f.read()).hexdigest()
+        
+        notion_sync = Mock()
+        notion_sync.state.file_checksums = {
+            unchanged_file: md5_checksum(unchanged_file),
+            changed_file: "stale checksum"
+        }
+        notion_sync.calculate_file_checksum.side_effect = md5_checksum
+        notion_sync.sync_file_to_notion.return_value = True
+        self.system.notion_sync = notion_sync
+        self.system.manus_client = Mock()
+        
+        events = [
+            FileChangeEvent(file_path=unchanged_file, event_type='modified', timestamp=time.time()),
+            FileChangeEvent(file_path=changed_file, event_type='modified', timestamp=time.time())
+        ]
+        
+        with patch.object(self.system, '_sync_file_to_manus') as mock_sync_to_manus:
+            self.system._handle_file_changes(events)
+            wait(list(self.system._pending_uploads))
+        
+        notion_sync.sync_file_to_notion.assert_called_once_with(changed_file)
+        self.assertEqual(sorted(call.args[0] for call in mock_sync_to_manus.call_args_list),
+                         sorted([unchanged_file, changed_file]))
+        self.assertEqual(self.system.stats.notion_updates, 1)
+
 class TestSystemValidation(unittest.TestCase):
     """System validation tests"""
     